@@ -7,116 +7,28 @@ from selenium.webdriver.support.ui import WebDriverWait
 import time
 from selenium.webdriver.common.keys import Keys
 
-BASE_URL = "http://localhost:8080"
-REGISTER_URL = f"{BASE_URL}/register.jsp"
-LOGIN_URL = f"{BASE_URL}/login.jsp"
-WELCOME_URL = f"{BASE_URL}/welcome.jsp"
-RS_URL = "register=success"
+from pages import WELCOME_URL
 
 class LoginValidationTests(TestBase):
     def __init__(self):
         super().__init__()
         self.timestamp = int(time.time())
-        # self.register_test_user()   
-        self.FALLBACK_EMAIL = "admin@system.com"          
-        self.FALLBACK_PASSWORD = "LA2028sGoldM"
 
-    def wait_for_sign_in_result(self, timeout=10):
-    
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.any_of(
-                    EC.url_contains("/welcome.jsp"),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'sign in')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'error')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'already been registered')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'⚠️')]"))
-                )
-            )
-        except TimeoutException:
-            logger.warning("Login/Registration result timeout")
-            
-    def register_test_user(self):
-        logger.info("Attempting to register a fresh test user...")
-
-        self.driver.get(REGISTER_URL)
-        try:
-            self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        except TimeoutException:
-            logger.error("Register page failed to load!")
-            self.test_email = self.FALLBACK_EMAIL
-            self.test_password = self.FALLBACK_PASSWORD
-            return False
-
-        safe_email = f"user{self.timestamp}@test.com"
-        safe_username = f"User{self.timestamp}"
-        safe_password = "Abc12345"
-
-        try:
-            self.driver.find_element(By.NAME, "username").clear()
-            self.driver.find_element(By.NAME, "username").send_keys(safe_username[-20:])
-
-            self.driver.find_element(By.NAME, "email").clear()
-            self.driver.find_element(By.NAME, "email").send_keys(safe_email[-100:])
-
-            self.driver.find_element(By.NAME, "password").clear()
-            self.driver.find_element(By.NAME, "password").send_keys(safe_password)
-
-            self.driver.find_element(By.NAME, "confirmPassword").clear()
-            self.driver.find_element(By.NAME, "confirmPassword").send_keys(safe_password)
-
-            # Agree to terms
-            try:
-                checkbox = self.driver.find_element(By.ID, "form2Example3c")
-                if not checkbox.is_selected():
-                    checkbox.click()
-            except:
-                pass  
-
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-
-            # Proper waiting: Wait only once; if successful, return True.
-            self.wait.until(EC.url_contains("login.jsp?register=success"))
-            logger.info(f"Fresh test user registered successfully: {safe_email}")
-            self.test_email = safe_email
-            self.test_password = safe_password
-            return True
-
-        except TimeoutException:
-            logger.error("Registration failed (timeout) → falling back to fixed safe account")
-        except WebDriverException as e:
-            logger.error(f"Registration crashed (WebDriver error): {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error during registration: {e}")
-
-        # All failure scenarios lead here → Use the fallback account
-        current_url = self.driver.current_url
-        logger.error(f"Registration failed. Current URL: {current_url} | Title: {self.driver.title}")
-        self.take_screenshot("REGISTER_FAILURE_DEBUG")
-
-        logger.warning("Using FALLBACK safe account for login tests")
-        self.test_email = self.FALLBACK_EMAIL
-        self.test_password = self.FALLBACK_PASSWORD
-        return False
-    
     # Test Case ID: test_LGN_002
     # Test Case Name: Missing Email 
     def missing_email(self):
         test_name = "LGN-002 - Missing Email (Submit Empty Email)"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
-        self.driver.get(LOGIN_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
+        self.login_page.open()
 
         # Intentionally leaving the email field blank and only filling in the password
-        self.driver.find_element(By.NAME, "email").clear()
-        self.driver.find_element(By.NAME, "password").send_keys("anything")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.login_page.fill("", "anything", clear=True)
+        self.login_page.submit()
 
         self.wait_for_sign_in_result()
 
-        page_source = self.driver.page_source.lower()
-        current_url = self.driver.current_url
+        current_url, page_source = self.login_page.result()
 
         # Expected Scenario：A prompt stating “Email is required” or similar must be displayed, and the page must not redirect.
         if ("email required" in page_source or 
@@ -142,29 +54,29 @@ class LoginValidationTests(TestBase):
     # Test Case Name: Email With Leading/Trailing Spaces
     def email_with_spaces(self):
         test_name = "LGN-006 - Email With Leading/Trailing Spaces"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
-        if not hasattr(self, 'test_email') or not self.test_email:
-            self.log_test_result(test_name, "SKIP", "Test user not registered, skipping")
-            return True
+        try:
+            account = self.lease_account()
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"No fixture account to log in with: {e}")
+            return False
 
         spaced_variants = [
-            f"  {self.test_email} ",
-            f"\t{self.test_email}\t",
-            f" {self.test_email}",
-            f"{self.test_email}  ",
+            f"  {account['email']} ",
+            f"\t{account['email']}\t",
+            f" {account['email']}",
+            f"{account['email']}  ",
         ]
 
         trimmed_success = 0
         total_tests = len(spaced_variants)
 
         for spaced_email in spaced_variants:
-            self.driver.get(LOGIN_URL)
-            self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
+            self.login_page.open()
 
-            self.driver.find_element(By.NAME, "email").send_keys(spaced_email)
-            self.driver.find_element(By.NAME, "password").send_keys(self.test_password)
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+            self.login_page.fill(spaced_email, account["password"])
+            self.login_page.submit()
 
             self.wait_for_sign_in_result()
 
@@ -199,7 +111,6 @@ class LoginValidationTests(TestBase):
             logger.info("STARTING LOGIN VALIDATION TESTS: LGN-002 & LGN-006")
             logger.info("="*80)
 
-            self.register_test_user()      
             self.missing_email()           
             self.email_with_spaces()      
 
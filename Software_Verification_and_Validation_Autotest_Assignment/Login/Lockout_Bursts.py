@@ -0,0 +1,163 @@
+# Lockout_Bursts.py
+from test_base import HttpTestBase, logger, LOCKOUT_THRESHOLD
+from http_client import HttpClient
+from fixture_accounts import account_pool
+from collections import Counter
+import http.client
+import os
+import time
+
+from pages import WELCOME_URL
+from race_harness import Racer, race
+
+BURST_PARALLELISM = int(os.environ.get("AUTOTEST_BURST_PARALLELISM", "20"))      # attempts released together
+BURST_ACCOUNTS = int(os.environ.get("AUTOTEST_BURST_ACCOUNTS", "10"))            # accounts attacked at once (LGN-017)
+BYSTANDERS = 3                  # accounts never attacked, which must keep working
+LOCK_MARKERS = ("locked", "too many", "try again later")
+WRONG_PASSWORD = "wrongpass123"
+
+class LockoutBurstTests(HttpTestBase):
+    def __init__(self):
+        super().__init__()
+        self.timestamp = int(time.time())
+
+    def burst(self, attempts, parallelism):
+        # attempts: [(email, password)], released in waves of `parallelism` simultaneous requests,
+        # each over its own connection -> [(email, outcome)]
+        results = []
+        for start in range(0, len(attempts), parallelism):
+            wave = attempts[start:start + parallelism]
+            racers = [Racer() for _ in wave]
+            try:
+                for racer, (email, password) in zip(racers, wave):
+                    racer.arm(racer.load_form("/login.jsp", "email"), {"email": email, "password": password})
+                race(racers)
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                logger.error(f"Burst wave could not be set up: {e}")
+                results.extend((email, "ERROR") for email, _ in wave)
+                continue
+            finally:
+                for racer in racers:
+                    racer.close()
+            for racer, (email, _) in zip(racers, wave):
+                if racer.error or racer.response.status >= 500:
+                    outcome = "ERROR"
+                elif WELCOME_URL in racer.response.url:
+                    outcome = "ACCEPTED"
+                elif any(marker in racer.response.text.lower() for marker in LOCK_MARKERS):
+                    outcome = "LOCKED"
+                else:
+                    outcome = "REJECTED"
+                results.append((email, outcome))
+        return results
+
+    def can_log_in(self, account):
+        try:
+            return WELCOME_URL in HttpClient().login(account["email"], account["password"]).url
+        except Exception as e:
+            logger.error(f"Verification login for {account['email']} failed: {e}")
+            return False
+
+    # Test Case ID: test_LGN_010 (burst)
+    # Test Case Name: Lockout under a burst of simultaneous failed logins against one account
+    def lockout_burst_single_account(self, parallelism=BURST_PARALLELISM):
+        test_name = "LGN-010/burst - Lockout under concurrent failed logins (one account)"
+        self.start_test(test_name, f"{parallelism} simultaneous wrong passwords, threshold {LOCKOUT_THRESHOLD}")
+
+        try:
+            account = self.lease_account()
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"No fixture account to attack: {e}")
+            return False
+
+        outcomes = Counter(outcome for _, outcome in
+                           self.burst([(account["email"], WRONG_PASSWORD)] * parallelism, parallelism))
+        account_pool.mark_locked(account)
+        # Every attempt answered without a lock message had its password checked: a guess that got through
+        guesses = outcomes["REJECTED"] + outcomes["ACCEPTED"]
+        locked = not self.can_log_in(account)
+        details = {"outcomes": dict(outcomes), "guesses_evaluated": guesses, "threshold": LOCKOUT_THRESHOLD,
+                   "parallelism": parallelism, "locked_afterwards": locked}
+
+        if outcomes["ERROR"]:
+            details["severity"] = "HIGH"
+            self.log_test_result(test_name, "FAIL", f"{outcomes['ERROR']} of {parallelism} attempts crashed/errored", details)
+            return False
+        if not locked:
+            details["severity"] = "CRITICAL"
+            self.log_test_result(test_name, "FAIL",
+                f"CRITICAL: Account NOT locked after {parallelism} simultaneous failed logins "
+                f"({guesses} evaluated as wrong password)", details)
+            return False
+        if guesses > LOCKOUT_THRESHOLD:
+            details["severity"] = "HIGH"
+            self.log_test_result(test_name, "FAIL",
+                f"Lockout counter lost updates: {guesses} guesses evaluated before lockout engaged "
+                f"(threshold {LOCKOUT_THRESHOLD})", details)
+            return False
+        self.log_test_result(test_name, "PASS",
+            f"Locked after {guesses} evaluated guesses of {parallelism} simultaneous attempts "
+            f"(threshold {LOCKOUT_THRESHOLD})", details)
+        return True
+
+    # Test Case ID: test_LGN_017 (burst)
+    # Test Case Name: Simultaneous failed logins across many accounts from one client; bystanders unaffected
+    def lockout_burst_many_accounts(self, accounts=BURST_ACCOUNTS, parallelism=BURST_PARALLELISM):
+        test_name = "LGN-017/burst - Lockout scope under concurrent failed logins (many accounts)"
+        self.start_test(test_name, f"{accounts} accounts x {LOCKOUT_THRESHOLD + 1} wrong passwords, {parallelism} at a time")
+
+        try:
+            targets = [self.lease_account() for _ in range(accounts)]
+            bystanders = [self.lease_account() for _ in range(BYSTANDERS)]
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"Not enough fixture accounts: {e}")
+            return False
+
+        # Interleaved so every wave hits many accounts at once, like a credential-stuffing run from one IP
+        attempts = [(account["email"], WRONG_PASSWORD) for _ in range(LOCKOUT_THRESHOLD + 1) for account in targets]
+        results = self.burst(attempts, parallelism)
+        for account in targets:
+            account_pool.mark_locked(account)
+
+        guesses = Counter(email for email, outcome in results if outcome in ("REJECTED", "ACCEPTED"))
+        errors = sum(1 for _, outcome in results if outcome == "ERROR")
+        over_threshold = {email: count for email, count in guesses.items() if count > LOCKOUT_THRESHOLD}
+        not_locked = [account["email"] for account in targets if self.can_log_in(account)]
+        bystanders_locked = [account["email"] for account in bystanders if not self.can_log_in(account)]
+        details = {"accounts": accounts, "parallelism": parallelism, "threshold": LOCKOUT_THRESHOLD,
+                   "guesses_evaluated": dict(guesses), "over_threshold": over_threshold, "not_locked": not_locked,
+                   "bystanders_locked": bystanders_locked, "errors": errors}
+
+        if bystanders_locked:
+            details["severity"] = "CRITICAL"
+            self.log_test_result(test_name, "FAIL",
+                f"CRITICAL: {len(bystanders_locked)}/{BYSTANDERS} untouched accounts locked out: "
+                "lockout is per client/IP or leaks across accounts", details)
+            return False
+        if not_locked or errors:
+            details["severity"] = "CRITICAL" if not_locked else "HIGH"
+            self.log_test_result(test_name, "FAIL",
+                f"{len(not_locked)}/{accounts} attacked accounts not locked, {errors} attempts errored", details)
+            return False
+        if over_threshold:
+            details["severity"] = "HIGH"
+            self.log_test_result(test_name, "FAIL",
+                f"Lockout counter lost updates on {len(over_threshold)} accounts "
+                f"(up to {max(over_threshold.values())} guesses, threshold {LOCKOUT_THRESHOLD})", details)
+            return False
+        self.log_test_result(test_name, "PASS",
+            f"All {accounts} attacked accounts locked within {LOCKOUT_THRESHOLD} guesses each; "
+            f"{BYSTANDERS} bystander accounts unaffected", details)
+        return True
+
+    def run_all_burst_tests(self):
+        logger.info("\n" + "="*70)
+        logger.info("STARTING LOCKOUT BURST TESTS (HTTP): LGN-010, 017")
+        logger.info("="*70)
+
+        self.lockout_burst_single_account()
+        self.lockout_burst_many_accounts()
+
+        logger.info("="*70)
+        logger.info("LOCKOUT BURST TEST SUITE COMPLETED")
+        logger.info("="*70)
@@ -0,0 +1,85 @@
+# Race_Conditions.py
+from test_base import HttpTestBase, logger
+from collections import Counter
+import http.client
+import time
+
+from pages import WELCOME_URL
+from race_harness import Racer, race, race_summary, RACE_RACERS, RACE_REPEATS
+
+class LoginRaceTests(HttpTestBase):
+    def __init__(self):
+        super().__init__()
+        self.timestamp = int(time.time())
+
+    # Test Case ID: test_LGN_016 (race)
+    # Test Case Name: N simultaneous logins of the same user over independent connections
+    def concurrent_login_race(self, racers=RACE_RACERS, repeats=RACE_REPEATS):
+        test_name = "LGN-016/race - Concurrent logins of the same user (N-way)"
+        self.start_test(test_name, f"{racers} racers x {repeats} races")
+
+        try:
+            account = self.lease_account()
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"No fixture account to race with: {e}")
+            return False
+
+        stats, refused, broken, shared_sessions = [], Counter(), set(), []
+        for k in range(repeats):
+            contenders = [Racer() for _ in range(racers)]
+            try:
+                for racer in contenders:
+                    form = racer.load_form("/login.jsp", "email")
+                    racer.arm(form, {"email": account["email"], "password": account["password"]})
+                stats.append(race(contenders))
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                logger.error(f"Race {k} could not be set up: {e}")
+                broken.add(k)
+                continue
+            finally:
+                for racer in contenders:
+                    racer.close()
+
+            winners = []
+            for racer in contenders:
+                if racer.error or racer.response.status >= 500:
+                    broken.add(k)
+                elif WELCOME_URL in racer.response.url:
+                    winners.append(racer)
+                else:
+                    refused[k] += 1
+            # Every successful login must get a session of its own
+            sessions = Counter(tuple(sorted(racer.cookies.items())) for racer in winners)
+            if any(count > 1 for count in sessions.values()):
+                shared_sessions.append(k)
+
+        summary = race_summary(stats)
+        details = {**summary, "racers": racers, "refused": dict(refused), "errors": sorted(broken),
+                   "shared_sessions": shared_sessions}
+        timing = (f"send skew p50 {summary['send_skew_ms_p50']} ms, max {summary['send_skew_ms_max']} ms, "
+                  f"response spread p50 {summary['response_spread_ms_p50']} ms")
+
+        if shared_sessions or broken:
+            details["severity"] = "CRITICAL" if shared_sessions else "HIGH"
+            self.log_test_result(test_name, "FAIL",
+                f"{len(shared_sessions)} races handed one session to several logins, "
+                f"{len(broken)} errored/crashed; {timing}", details)
+            return False
+        if refused:
+            self.log_test_result(test_name, "WARN",
+                f"{sum(refused.values())} valid logins refused under concurrency in {len(refused)} races; {timing}", details)
+            return False
+        self.log_test_result(test_name, "PASS",
+            f"All {racers} simultaneous logins succeeded with distinct sessions in {len(stats)} races; {timing}", details)
+        return True
+
+    def run_all_race_tests(self):
+        logger.info("\n" + "="*70)
+        logger.info("STARTING LOGIN RACE TESTS (HTTP): LGN-016")
+        logger.info("="*70)
+
+        self.concurrent_login_race()
+
+        logger.info("="*70)
+        logger.info("LOGIN RACE TEST SUITE COMPLETED")
+        logger.info("="*70)
@@ -1,39 +1,24 @@
 # Security.py
-from test_base import TestBase, logger
+from test_base import TestBase, logger, LOCKOUT_THRESHOLD
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 import time
 import threading
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from driver_pool import driver_pool
+from fixture_accounts import account_pool
 
-BASE_URL = "http://localhost:8080"
-LOGIN_URL = f"{BASE_URL}/login.jsp"
-WELCOME_URL = f"{BASE_URL}/welcome.jsp"
+from pages import LOGIN_URL, WELCOME_URL
+from case_tables import load_table, row_name
 
 class LoginSecurityTests(TestBase):
     def __init__(self):
         super().__init__()
         self.timestamp = int(time.time())
-        self.FALLBACK_EMAIL = "admin@system.com"
-        self.FALLBACK_PASSWORD = "LA2028sGoldM"
         self.TEST_EMAIL = "testuser@loginsec.com"
         self.TEST_PASSWORD = "Test12345"
 
-    def wait_for_login_result(self, timeout=10):
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.any_of(
-                    EC.url_to_be(WELCOME_URL),
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class,'error-message') or contains(text(),'Incorrect') or contains(text(),'locked')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'Invalid credentials') or contains(text(),'too many')]"))
-                )
-            )
-        except TimeoutException:
-            logger.warning("Login result wait timeout")
-    
     def switch_to_window(self, window_name_or_index):
         handles = self.driver.window_handles
         
@@ -51,123 +36,127 @@ class LoginSecurityTests(TestBase):
     # Test Case Name: Account Lockout After Consecutive Failed Logins
     def account_lockout_after_failed_attempts(self):
         test_name = "LGN-010 - Account Lockout After Consecutive Failed Logins"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
+
+        try:
+            account = self.lease_account()
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"No fixture account to lock out: {e}")
+            return False
 
-        self.driver.get(LOGIN_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
+        self.login_page.open()
 
-        # 5 times wrong password
-        for i in range(5):
-            self.driver.find_element(By.NAME, "email").clear()
-            self.driver.find_element(By.NAME, "email").send_keys(self.FALLBACK_EMAIL)
-            self.driver.find_element(By.NAME, "password").clear()
-            self.driver.find_element(By.NAME, "password").send_keys("wrongpass123")
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-            time.sleep(1.5) 
+        # Wrong password until the lockout threshold is reached
+        for i in range(LOCKOUT_THRESHOLD):
+            self.login_page.fill(account["email"], "wrongpass123", clear=True)
+            self.login_page.submit()
+            self.wait_for_login_result()
+        # Whatever the verdict, never hand this account to another test
+        account_pool.mark_locked(account)
 
         # Try correct password 
-        self.driver.find_element(By.NAME, "email").clear()
-        self.driver.find_element(By.NAME, "email").send_keys(self.FALLBACK_EMAIL)
-        self.driver.find_element(By.NAME, "password").clear()
-        self.driver.find_element(By.NAME, "password").send_keys(self.FALLBACK_PASSWORD)
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.login_page.fill(account["email"], account["password"], clear=True)
+        self.login_page.submit()
 
         self.wait_for_login_result()
 
-        page_source = self.driver.page_source.lower()
-        current_url = self.driver.current_url
+        current_url, page_source = self.login_page.result()
 
         if WELCOME_URL in current_url:
             self.take_screenshot("LGN010_NO_LOCKOUT")
-            self.log_test_result(test_name, "FAIL", "CRITICAL: Account NOT locked after 5 failed attempts!", {"severity": "CRITICAL"})
+            self.log_test_result(test_name, "FAIL", f"CRITICAL: Account NOT locked after {LOCKOUT_THRESHOLD} failed attempts!", {"severity": "CRITICAL"})
             return False
         else:
             if ("locked" in page_source or "too many" in page_source or "try again later" in page_source or
                 "account is locked" in page_source or "generic error" in page_source):
-                self.log_test_result(test_name, "PASS", "Account correctly locked after 5 failed attempts")
+                self.log_test_result(test_name, "PASS", f"Account correctly locked after {LOCKOUT_THRESHOLD} failed attempts")
                 return True
             else:
-                self.take_screenshot("LOGIN010_generic_or_no_message")
+                self.take_screenshot("LGN010_generic_or_no_message")
                 self.log_test_result(test_name, "FAIL", "Account locked but no clear lock message (generic error shown?)")
                 return False
 
     # Test Case ID: test_LGN_011
     # Test Case Name: Common/Default Admin Password Check & Weak Credential Rejection
-    def common_admin_passwords_and_weak_credential_handling(self):
+    def common_admin_passwords_and_weak_credential_handling(self, rows=None):
         test_name = "LGN-011 - Common/Default Admin Passwords & Weak Credential Rejection"
-        logger.info(f"Starting {test_name}")
-
-        common_creds = [
-            ("admin", "admin"),
-            ("admin", "123456"),
-            ("admin", "password"),
-            ("admin@system.com", "admin"),
-            ("admin@system.com", "123456"),
-            ("admin@system.com", "root"),
-            ("admin@system.com", "LA2028sGoldM"),   # This one should succeed (fallback admin)
-        ]
-
-        success_count = 0
-        total = len(common_creds)
-
-        for email, password in common_creds:
-            self.driver.get(LOGIN_URL)
-            self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-
-            self.driver.find_element(By.NAME, "email").send_keys(email)
-            self.driver.find_element(By.NAME, "password").send_keys(password)
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-
-            self.wait_for_login_result(12)
-
-            if WELCOME_URL in self.driver.current_url:
-                if password == "LA2028sGoldM" and email == "admin@system.com":
-                    success_count += 1
-                    logger.info(f"Expected success: {email} with strong password")
-                else:
-                    self.take_screenshot(f"LGN011_WEAK_CRED_SUCCESS_{email.replace('@', '_')}")
-                    logger.error(f"Login succeeded with weak/common credential: {email}/{password}")
-            else:
-                page_source = self.driver.page_source.lower()
-                if "invalid credentials" in page_source or "incorrect" in page_source:
-                    if password != "LA2028sGoldM" or email != "admin@system.com":
-                        success_count += 1  # Expected rejection
+        self.start_test(test_name)
+
+        results = []
+        for row in load_table("LGN-011", rows):
+            email, password = row["email"], row["password"]
+            try:
+                self.login_page.open()
+
+                self.login_page.fill(email, password)
+                self.login_page.submit()
+
+                self.wait_for_login_result(12)
+
+                current_url, page_source = self.login_page.result()
+                if WELCOME_URL in current_url:
+                    if row["expected"] == "ACCEPT":
+                        logger.info(f"Expected success: {email} with strong password")
+                        self.log_test_result(row_name(test_name, row), "PASS", f"Real admin credential accepted: {email}")
+                        results.append(True)
+                    else:
+                        self.take_screenshot(f"LGN011_WEAK_CRED_SUCCESS_{row['id']}")
+                        logger.error(f"Login succeeded with weak/common credential: {email}/{password}")
+                        self.log_test_result(row_name(test_name, row), "FAIL",
+                            f"Weak/common credential allowed: {email}/{password}", {"severity": "CRITICAL"})
+                        results.append(False)
+                elif row["expected"] == "REJECT" and ("invalid credentials" in page_source or "incorrect" in page_source):
+                    # Expected rejection
+                    self.log_test_result(row_name(test_name, row), "PASS", f"Weak/common credential rejected: {email}/{password}")
+                    results.append(True)
+                elif row["expected"] == "ACCEPT" and ("locked" in page_source or "too many" in page_source):
+                    # The weak-password rows before it locked the real admin account: refusing it is correct
+                    self.log_test_result(row_name(test_name, row), "PASS",
+                        f"Real admin credential refused because the weak rows locked the account: {email}",
+                        {"note": "account locked by earlier rows"})
+                    results.append(True)
                 else:
+                    # Neither accepted nor clearly rejected: no weak credential got in, but the answer needs a look
                     logger.warning(f"Unclear response for {email}/{password}")
+                    self.take_screenshot(f"LGN011_UNCLEAR_{row['id']}")
+                    self.log_test_result(row_name(test_name, row), "WARN",
+                        f"Unclear response for {email}/{password}", {"note": "unclear response"})
+                    results.append(True)
 
-        passed = success_count >= total - 1  
-        if success_count == total - 1 or success_count == total:
-            self.log_test_result(test_name, "PASS", f"Properly rejected weak/common admin credentials ({success_count}/{total} correct)")
-            return True
-        else:
-            self.log_test_result(test_name, "FAIL", f"Too many weak credentials allowed ({success_count}/{total})")
-            return False
+            except Exception as e:
+                self.log_test_result(row_name(test_name, row), "FAIL", f"Exception: {str(e)}")
+                results.append(False)
+
+        return all(results)
 
     # Test Case ID: test_LGN_016
     # Test Case Name: Concurrent Login with Same User in Two Browsers (Session Fixation / Multiple Session Check)
     def concurrent_login_same_user(self):
         test_name = "LGN-016 - Concurrent Login with Same User (Session Handling)"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
+
+        try:
+            account = self.lease_account()
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"No fixture account to log in with: {e}")
+            return False
 
-        options = Options()
-        #options.add_argument("--headless") if self.headless else None
-        driver2 = webdriver.Chrome(options=options)
+        # Second, independent browser session (separate cookie jar) from the pool
+        driver2 = driver_pool.lease()
 
         try:
             # First login
-            self.driver.get(LOGIN_URL)
-            self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-            self.driver.find_element(By.NAME, "email").send_keys(self.FALLBACK_EMAIL)
-            self.driver.find_element(By.NAME, "password").send_keys(self.FALLBACK_PASSWORD)
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+            self.login_page.open()
+            self.login_page.fill(account["email"], account["password"])
+            self.login_page.submit()
             self.wait.until(EC.url_to_be(WELCOME_URL))
             logger.info("First session established")
 
             # Second login in parallel (simulate another browser)
             driver2.get(LOGIN_URL)
             WebDriverWait(driver2, 10).until(EC.presence_of_element_located((By.NAME, "email")))
-            driver2.find_element(By.NAME, "email").send_keys(self.FALLBACK_EMAIL)
-            driver2.find_element(By.NAME, "password").send_keys(self.FALLBACK_PASSWORD)
+            driver2.find_element(By.NAME, "email").send_keys(account["email"])
+            driver2.find_element(By.NAME, "password").send_keys(account["password"])
             driver2.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
             WebDriverWait(driver2, 10).until(EC.url_to_be(WELCOME_URL))
             logger.info("Second session established")
@@ -176,7 +165,8 @@ class LoginSecurityTests(TestBase):
             self.driver.get(WELCOME_URL)
             driver2.get(WELCOME_URL)
 
-            time.sleep(2)
+            self.wait_for_page_ready()
+            self.wait_for_page_ready(driver2)
 
             session1_valid = "Welcome back" in self.driver.page_source
             session2_valid = "Welcome back" in driver2.page_source
@@ -200,42 +190,46 @@ class LoginSecurityTests(TestBase):
             
             return False
         finally:
-            driver2.quit()
+            driver_pool.release(driver2)
 
     # Test Case ID: test_LGN_017
     # Test Case Name: Account Lockout Scope on Same IP by Different Users
     def lockout_scope_per_account_not_per_ip(self):
         test_name = "LGN-017 - Account Lockout Scope (Per Account, Not Per IP)"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
-        user_a_email = "usera@loginsec.com"
-        user_b_email = "userb@loginsec.com"
+        try:
+            user_a = self.lease_account()
+            user_b = self.lease_account()
+        except RuntimeError as e:
+            self.log_test_result(test_name, "ERROR", f"No fixture accounts for users A and B: {e}")
+            return False
         wrong_pass = "wrong123"
 
-        # Trigger 5 failed attempts for User A (fallback admin)
-        self.driver.get(LOGIN_URL)
-        for i in range(5):
-            self.driver.find_element(By.NAME, "email").clear()
-            self.driver.find_element(By.NAME, "email").send_keys(self.FALLBACK_EMAIL)
-            self.driver.find_element(By.NAME, "password").clear()
-            self.driver.find_element(By.NAME, "password").send_keys(wrong_pass)
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-            time.sleep(1.2)
+        # Trigger the lockout threshold's worth of failed attempts for User A
+        self.login_page.open()
+        for i in range(LOCKOUT_THRESHOLD):
+            self.login_page.fill(user_a["email"], wrong_pass, clear=True)
+            self.login_page.submit()
+            self.wait_for_login_result()
+        account_pool.mark_locked(user_a)
 
         # Try login as User B (should still work)
-        self.driver.get(LOGIN_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "email").send_keys("nonexistent@test.com")
-        self.driver.find_element(By.NAME, "password").send_keys("any")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.login_page.open()
+        self.login_page.fill(user_b["email"], user_b["password"])
+        self.login_page.submit()
         self.wait_for_login_result()
 
-        page_source = self.driver.page_source.lower()
+        current_url, page_source = self.login_page.result()
 
         if "locked" in page_source or "too many" in page_source:
             self.take_screenshot("LGN017_IP_BASED_LOCK")
             self.log_test_result(test_name, "FAIL", "CRITICAL: Lockout appears to be IP-based, not account-based!", {"severity": "CRITICAL"})
             return False
+        elif WELCOME_URL not in current_url:
+            self.take_screenshot("LGN017_USER_B_LOGIN_FAILED")
+            self.log_test_result(test_name, "FAIL", "User B could not log in after User A was locked out")
+            return False
         else:
             self.log_test_result(test_name, "PASS", "Lockout is correctly per-account: User B unaffected by User A's failed attempts")
             return True
@@ -1,6 +1,8 @@
 # login_tests.py
 from .Basic_Authentication import LoginValidationTests
 from .Security import LoginSecurityTests
+from .Race_Conditions import LoginRaceTests
+from .Lockout_Bursts import LockoutBurstTests
 from test_base import TestBase, logger
 
 class LoginTests(TestBase):
@@ -8,22 +10,19 @@ class LoginTests(TestBase):
         super().__init__()
         self.validation_tests = LoginValidationTests()
         self.security_tests = LoginSecurityTests()
+        self.race_tests = LoginRaceTests()
+        self.burst_tests = LockoutBurstTests()
 
     def run_all_login_tests(self):
-        if not self.setup():
-            return
+        logger.info("\n" + "="*80)
+        logger.info("STARTING FULL LOGIN TEST SUITE")
+        logger.info("="*80)
 
-        try:
-            logger.info("\n" + "="*80)
-            logger.info("STARTING FULL LOGIN TEST SUITE")
-            logger.info("="*80)
+        self.validation_tests.run_all_loginvalidation_tests()
+        self.security_tests.run_all_security_tests()
+        self.race_tests.run_all_race_tests()
+        self.burst_tests.run_all_burst_tests()
 
-            self.validation_tests.run_all_loginvalidation_tests()
-            self.security_tests.run_all_security_tests()
-
-            logger.info("="*80)
-            logger.info("FULL LOGIN TEST SUITE COMPLETED")
-            logger.info("="*80)
-
-        finally:
-            self.teardown()
\ No newline at end of file
+        logger.info("="*80)
+        logger.info("FULL LOGIN TEST SUITE COMPLETED")
+        logger.info("="*80)
\ No newline at end of file
@@ -0,0 +1,167 @@
+# Backend_Validation.py
+from test_base import HttpTestBase, logger
+from http_client import HttpClient
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+from pages import RS_URL
+from case_tables import load_table, row_name
+from timeline import timeline
+
+# Concurrent HTTP registrations per case table (connections come from http_client's shared pool)
+HTTP_WORKERS = int(os.environ.get("AUTOTEST_HTTP_WORKERS", "8"))
+
+def classify(response):
+    current_url, page_source = response.result()
+    if response.status >= 500 or "exception" in page_source:
+        return "CRASH"
+    if RS_URL in current_url or "sign in" in page_source:
+        return "ACCEPTED"
+    if "already been registered" in page_source:
+        return "DUPLICATE"
+    return "REJECTED"
+
+class BackendValidationTests(HttpTestBase):
+    def __init__(self):
+        super().__init__()
+        self.timestamp = int(time.time())
+
+    def register_all(self, submissions):
+        # submissions: [(username, email, password)] -> [(submission, outcome)], executed concurrently
+        test_id = timeline.current_test()
+
+        def submit(submission):
+            timeline.set_test(test_id)
+            try:
+                return submission, classify(HttpClient().register(*submission))
+            except Exception as e:
+                logger.error(f"HTTP registration failed for {submission[1][:40]}: {e}")
+                return submission, "ERROR"
+
+        with ThreadPoolExecutor(max_workers=HTTP_WORKERS) as executor:
+            return list(executor.map(submit, submissions))
+
+    #Test Case ID: test_REG_020 (HTTP)
+    #Test Case Name: Invalid Email Formats, backend only
+    def invalid_email_formats(self, rows=None):
+        test_name = "REG-020/http - Invalid Email Formats"
+        self.start_test(test_name)
+
+        table = load_table("REG-020", rows)
+        results = self.register_all([(f"user020h_{self.timestamp}_{row['id']}", row["email"], "Test1234abcd")
+                                     for row in table])
+
+        # One result per table row, like the browser port, so a rerun can pick out the failed rows
+        passed = []
+        for row, (_, outcome) in zip(table, results):
+            email = row["email"]
+            if outcome == "ACCEPTED":
+                self.log_test_result(row_name(test_name, row), "FAIL",
+                    f"Backend accepted invalid email: {email}", {"severity": "HIGH", "accepted": email})
+            elif outcome in ("CRASH", "ERROR"):
+                self.log_test_result(row_name(test_name, row), "FAIL",
+                    f"Backend errored on invalid email: {email}", {"severity": "HIGH", "outcome": outcome})
+            else:
+                self.log_test_result(row_name(test_name, row), "PASS", f"Backend rejected invalid email: {email}")
+            passed.append(outcome not in ("ACCEPTED", "CRASH", "ERROR"))
+        return all(passed)
+
+    #Test Case ID: test_REG_021 (HTTP)
+    #Test Case Name: Excessive Email Length, backend only
+    def excessive_email_length_boundary(self, rows=None):
+        test_name = "REG-021/http - Excessive Email Length Boundary Test"
+        self.start_test(test_name)
+
+        table = load_table("REG-021", rows)
+        results = self.register_all([(f"user021h_{self.timestamp}_{row['id']}", row["email"], "Test1234abcd")
+                                     for row in table])
+
+        passed = []
+        for row, (_, outcome) in zip(table, results):
+            length = len(row["email"])
+            if outcome in ("CRASH", "ERROR"):
+                self.log_test_result(row_name(test_name, row), "FAIL",
+                    f"CRITICAL: Backend crashed with {length}-char email!", {"severity": "CRITICAL", "email_length": length})
+            else:
+                self.log_test_result(row_name(test_name, row), "PASS",
+                    f"Backend safely handled {length}-char email ({outcome.lower()}) - no crash")
+            passed.append(outcome not in ("CRASH", "ERROR"))
+        return all(passed)
+
+    #Test Case ID: test_REG_014 (HTTP)
+    #Test Case Name: Password Illegal & Special Characters, backend only
+    def password_illegal_special_characters(self, rows=None):
+        test_name = "REG-014/http - Password Field Illegal & Special Characters Handling"
+        self.start_test(test_name)
+
+        table = load_table("REG-014", rows)
+        results = self.register_all([(f"user014h_{self.timestamp}_{row['id']}", f"reg014h_{self.timestamp}_{row['id']}@test.com",
+                                      row["password"]) for row in table])
+
+        passed = []
+        for row, (_, outcome) in zip(table, results):
+            pwd = row["password"]
+            if outcome in ("CRASH", "ERROR"):
+                self.log_test_result(row_name(test_name, row), "FAIL",
+                    f"CRITICAL: Backend crashed with password: {pwd.encode('unicode_escape')}",
+                    {"severity": "CRITICAL", "input": pwd})
+            else:
+                self.log_test_result(row_name(test_name, row), "PASS",
+                    f"Backend handled password cleanly ({outcome.lower()}): {pwd.encode('unicode_escape')}")
+            passed.append(outcome not in ("CRASH", "ERROR"))
+        return all(passed)
+
+    #Test Case ID: test_REG_016 (HTTP)
+    #Test Case Name: Excessive Username Length, backend only
+    def excessive_username_length_boundary(self, rows=None):
+        test_name = "REG-016/http - Excessive Username Length Boundary Test"
+        self.start_test(test_name)
+
+        table = load_table("REG-016", rows)
+        results = self.register_all([(row["username"], f"reg016h_{self.timestamp}_{row['id']}@test.com", "Test1234abcd")
+                                     for row in table])
+
+        passed = []
+        for row, (_, outcome) in zip(table, results):
+            length = len(row["username"])
+            if outcome in ("CRASH", "ERROR"):
+                self.log_test_result(row_name(test_name, row), "FAIL",
+                    f"CRITICAL: Backend crashed with {length}-char username!", {"severity": "CRITICAL", "length": length})
+            else:
+                self.log_test_result(row_name(test_name, row), "PASS",
+                    f"Backend safely handled {length}-char username ({outcome.lower()}) - no crash")
+            passed.append(outcome not in ("CRASH", "ERROR"))
+        return all(passed)
+
+    #Test Case ID: test_REG_062 (HTTP)
+    #Test Case Name: Weak/invalid data posted directly, no frontend at all
+    def bypass_frontend_validation(self):
+        test_name = "REG-062/http - Bypass Frontend Validation"
+        self.start_test(test_name)
+
+        (_, outcome), = self.register_all([(f"bypass{self.timestamp}h", "bypass@evil.com", "Weak1")])
+        if outcome == "ACCEPTED":
+            self.log_test_result(test_name, "FAIL", "CRITICAL: Backend accepted weak/invalid data posted directly!",
+                {"severity": "CRITICAL"})
+            return False
+        if outcome in ("CRASH", "ERROR"):
+            self.log_test_result(test_name, "FAIL", "Backend errored on directly posted data")
+            return False
+        self.log_test_result(test_name, "PASS", "Backend rejected weak/invalid data posted directly")
+        return True
+
+    def run_all_backend_tests(self):
+        logger.info("\n" + "="*70)
+        logger.info("STARTING BACKEND VALIDATION TESTS (HTTP): REG-020, 021, 014, 016, 062")
+        logger.info("="*70)
+
+        self.invalid_email_formats()
+        self.excessive_email_length_boundary()
+        self.password_illegal_special_characters()
+        self.excessive_username_length_boundary()
+        self.bypass_frontend_validation()
+
+        logger.info("="*70)
+        logger.info("BACKEND VALIDATION TEST SUITE COMPLETED")
+        logger.info("="*70)
@@ -0,0 +1,134 @@
+# Email_Fuzzing.py
+from test_base import HttpTestBase, logger
+from http_client import HttpClient
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+import os
+import time
+import threading
+
+from email_fuzzer import generate, MUTATIONS
+from email_oracle import check, disagreement
+from .Backend_Validation import classify
+from timeline import timeline
+
+FUZZ_COUNT = int(os.environ.get("AUTOTEST_FUZZ_COUNT", "10000"))
+FUZZ_CONCURRENCY = int(os.environ.get("AUTOTEST_FUZZ_CONCURRENCY", "64"))   # registrations in flight
+FUZZ_SEED = int(os.environ.get("AUTOTEST_FUZZ_SEED", "0"))
+SAMPLES_PER_CLASS = 20          # noteworthy addresses kept per mutation class and outcome for the report
+NOTEWORTHY = ("ACCEPTED", "CRASH", "ERROR", "ACCEPTED_INVALID", "REJECTED_VALID")
+SERVER_OUTCOMES = ("ACCEPTED", "REJECTED", "DUPLICATE", "CRASH", "ERROR")
+PROGRESS_EVERY = 10000
+
+class EmailFuzzTests(HttpTestBase):
+    def __init__(self):
+        super().__init__()
+        self.timestamp = int(time.time())
+
+    #Test Case ID: test_REG_020 (fuzz)
+    #Test Case Name: Generative Email Fuzzing over the HTTP fast path
+    def email_fuzzing(self, count=FUZZ_COUNT, concurrency=FUZZ_CONCURRENCY, seed=FUZZ_SEED, classes=None):
+        test_name = "REG-020/fuzz - Generative Email Fuzzing"
+        self.start_test(test_name, f"{count} addresses, {concurrency} in flight, seed {seed}")
+
+        # Addresses are generated lazily and pulled by the workers, so memory stays flat for any count
+        cases = generate(count, seed, classes)
+        cases_lock = threading.Lock()
+        stop = threading.Event()        # set when a worker fails to start: the run is void, the rest quit early
+        started = time.monotonic()
+        test_id = timeline.current_test()
+
+        def worker():
+            timeline.set_test(test_id)
+            client = HttpClient()
+            form = client.load_form(f"{client.base_url}/register.jsp", "email")
+            counts, samples = {}, {}
+            while not stop.is_set():
+                with cases_lock:
+                    case = next(cases, None)
+                if case is None:
+                    break
+                n, mutation, email = case
+                if n and n % PROGRESS_EVERY == 0:
+                    logger.info(f"Fuzzed {n} addresses ({n / (time.monotonic() - started):.0f}/s)")
+
+                try:
+                    # Only the redirect target matters, so the success page is never fetched
+                    response = client.register(f"fz{self.timestamp}_{n}", email, "Test1234abcd",
+                                               form=form, follow_redirects=False)
+                    outcome = classify(response)
+                except Exception:
+                    outcome = "ERROR"
+
+                # Differential check: the reference oracle decides whether the server should have accepted it
+                outcomes = [outcome]
+                if outcome in ("ACCEPTED", "REJECTED"):
+                    verdict = disagreement(email, outcome == "ACCEPTED")
+                    if verdict:
+                        outcomes.append(verdict.upper())
+
+                counter = counts.setdefault(mutation, Counter())
+                for outcome in outcomes:
+                    counter[outcome] += 1
+                    if outcome in NOTEWORTHY:
+                        kept = samples.setdefault(mutation, {}).setdefault(outcome, [])
+                        if len(kept) < SAMPLES_PER_CLASS:
+                            kept.append(email if outcome != "ACCEPTED_INVALID" else f"{email} ({check(email)})")
+            return counts, samples
+
+        totals, samples = {}, {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(worker) for _ in range(concurrency)]
+            for future in futures:
+                try:
+                    worker_counts, worker_samples = future.result()
+                except Exception as e:
+                    # Don't let the other workers drain the generator for results that are thrown away
+                    stop.set()
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    self.log_test_result(test_name, "ERROR", f"Fuzz worker could not start: {e}")
+                    return False
+                for mutation, counter in worker_counts.items():
+                    totals.setdefault(mutation, Counter()).update(counter)
+                for mutation, by_outcome in worker_samples.items():
+                    for outcome, emails in by_outcome.items():
+                        kept = samples.setdefault(mutation, {}).setdefault(outcome, [])
+                        kept.extend(emails[:SAMPLES_PER_CLASS - len(kept)])
+
+        elapsed = time.monotonic() - started
+        sent = sum(counter[outcome] for counter in totals.values() for outcome in SERVER_OUTCOMES)
+        logger.info(f"{test_name}: {sent} addresses in {elapsed:.1f}s ({sent / elapsed if elapsed else 0:.0f}/s)")
+
+        # One result per mutation class: crashes, errors and invalid addresses the oracle says the server
+        # accepted fail; valid addresses the server refused only warn, like REG-022
+        all_clean = True
+        for mutation in (classes or MUTATIONS):
+            counter = totals.get(mutation, Counter())
+            total = sum(counter[outcome] for outcome in SERVER_OUTCOMES)
+            if not total:
+                continue
+            broken = counter["CRASH"] + counter["ERROR"]
+            details = {"counts": dict(counter), "acceptance_rate": round(counter["ACCEPTED"] / total, 4),
+                       "samples": samples.get(mutation, {}), "seed": seed}
+            message = (f"{counter['ACCEPTED']}/{total} accepted ({counter['ACCEPTED'] / total:.1%}), "
+                       f"{broken} crashed/errored, oracle disagreements: {counter['ACCEPTED_INVALID']} invalid accepted, "
+                       f"{counter['REJECTED_VALID']} valid rejected")
+            if broken or counter["ACCEPTED_INVALID"]:
+                details["severity"] = "CRITICAL" if counter["CRASH"] else "HIGH"
+                status = "FAIL"
+                all_clean = False
+            else:
+                status = "WARN" if counter["REJECTED_VALID"] else "PASS"
+            self.log_test_result(f"{test_name} [{mutation}]", status, message, details)
+        return all_clean
+
+    def run_all_fuzz_tests(self, count=FUZZ_COUNT, seed=FUZZ_SEED):
+        logger.info("\n" + "="*70)
+        logger.info("STARTING EMAIL FUZZING CAMPAIGN (HTTP)")
+        logger.info("="*70)
+
+        self.email_fuzzing(count=count, seed=seed)
+
+        logger.info("="*70)
+        logger.info("EMAIL FUZZING CAMPAIGN COMPLETED")
+        logger.info("="*70)
@@ -1,16 +1,16 @@
 # Input_Normalization_Robustness.py
-from test_base import TestBase, logger
+from test_base import TestBase, logger, TIMEOUT
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
 import time
 import threading
+from driver_pool import driver_pool
 
-BASE_URL = "http://localhost:8080"
-REGISTER_URL = f"{BASE_URL}/register.jsp"
-LOGIN_URL = f"{BASE_URL}/login.jsp"
-RS_URL = "register=success"
+from pages import REGISTER_URL, RS_URL
+from result_detector import mark_submit, wait_for_outcome, REGISTRATION_OUTCOME
 
 class AdvancedInputCaseTests(TestBase):
     def __init__(self):
@@ -19,20 +19,6 @@ class AdvancedInputCaseTests(TestBase):
         self.test_email = f"edge{self.timestamp}@test.com"
         self.test_password = "Test1234abcd"
 
-    def wait_for_registration_result(self, timeout=10):
-        try:
-            self.wait.until(
-                EC.any_of(
-                    EC.url_contains("/login.jsp?register=success"),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'sign in')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'error')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'already been registered')]")),
-                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(),'⚠️')]"))
-                )
-            )
-        except TimeoutException:
-            logger.warning("Waiting for registration result timed out")
-
     def switch_to_window(self, window_name_or_index):
         handles = self.driver.window_handles
         
@@ -50,7 +36,7 @@ class AdvancedInputCaseTests(TestBase):
     #Test Case Name: Email with Spaces
     def email_with_spaces(self):
         test_name = "REG-060 - Email with Leading/Trailing Spaces"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
         spaced_emails = [
             f"  1{self.test_email} ",      # Spaces before and after
@@ -60,15 +46,10 @@ class AdvancedInputCaseTests(TestBase):
         ]
 
         for email in spaced_emails:
-            self.driver.get(REGISTER_URL)
-            self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-
-            self.driver.find_element(By.NAME, "username").send_keys(f"user070_{self.timestamp}")
-            self.driver.find_element(By.NAME, "email").send_keys(email)
-            self.driver.find_element(By.NAME, "password").send_keys(self.test_password)
-            self.driver.find_element(By.NAME, "confirmPassword").send_keys(self.test_password)
-            self.driver.find_element(By.ID, "form2Example3c").click()
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+            self.register_page.open()
+
+            self.register_page.fill(f"user070_{self.timestamp}", email, self.test_password)
+            self.register_page.submit()
             self.wait_for_registration_result()
             page_source = self.driver.page_source.lower()
             if RS_URL in self.driver.current_url or "sign in" in page_source:
@@ -85,19 +66,14 @@ class AdvancedInputCaseTests(TestBase):
     #Test Case Name: Email Case Handling
     def email_case_handling(self):
         test_name = "REG-061 - Email Case Insensitive Duplicate Handling"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
         emails = [f"CaseTest{self.timestamp}@Gmail.com", f"casetest{self.timestamp}@gmail.com"]
 
         # First Scenario: Registration of the uppercase version
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "username").send_keys("user071_first")
-        self.driver.find_element(By.NAME, "email").send_keys(emails[0])
-        self.driver.find_element(By.NAME, "password").send_keys(self.test_password)
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys(self.test_password)
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.open()
+        self.register_page.fill("user071_first", emails[0], self.test_password)
+        self.register_page.submit()
         self.wait_for_registration_result()
         page_source = self.driver.page_source.lower()
         if RS_URL not in self.driver.current_url or "sign in" not in page_source:
@@ -105,14 +81,9 @@ class AdvancedInputCaseTests(TestBase):
             return False
 
         # Second Scenario: Attempt to register lowercase version → Should prompt for duplicate
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "username").send_keys("user071_duplicate")
-        self.driver.find_element(By.NAME, "email").send_keys(emails[1])
-        self.driver.find_element(By.NAME, "password").send_keys(self.test_password)
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys(self.test_password)
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.open()
+        self.register_page.fill("user071_duplicate", emails[1], self.test_password)
+        self.register_page.submit()
         self.wait_for_registration_result()
 
         page_source = self.driver.page_source.lower()
@@ -128,21 +99,20 @@ class AdvancedInputCaseTests(TestBase):
     #Test Case Name: Bypass Frontend Validation
     def bypass_frontend_validation(self):
         test_name = "REG-062 - Bypass Frontend Validation with JS Injection"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
+        self.register_page.open()
 
         # Directly setting invalid email addresses using JavaScript (bypassing frontend regular expressions)
         invalid_email = "bypass@evil.com"
         self.driver.execute_script(f"document.getElementsByName('email')[0].value = '{invalid_email}';")
         self.driver.execute_script("document.getElementsByName('email')[0].dispatchEvent(new Event('input'));")
 
-        self.driver.find_element(By.NAME, "username").send_keys(f"bypass{self.timestamp}")
-        self.driver.find_element(By.NAME, "password").send_keys("Weak1")
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys("Weak1")
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.element("username").send_keys(f"bypass{self.timestamp}")
+        self.register_page.element("password").send_keys("Weak1")
+        self.register_page.element("confirmPassword").send_keys("Weak1")
+        self.register_page.element("terms").click()
+        self.register_page.submit()
 
         self.wait_for_registration_result()
         page_source = self.driver.page_source.lower()
@@ -158,17 +128,12 @@ class AdvancedInputCaseTests(TestBase):
     #Test Case Name: Password With Leading/Trailing Spaces
     def password_with_spaces(self):
         test_name = "REG-063 - Password Leading/Trailing Spaces Handling"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
         spaced_pwd = "  Test1234abcd  "
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "username").send_keys(f"user073_{self.timestamp}")
-        self.driver.find_element(By.NAME, "email").send_keys(f"pwdspace{self.timestamp}@test.com")
-        self.driver.find_element(By.NAME, "password").send_keys(spaced_pwd)
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys(spaced_pwd)
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.open()
+        self.register_page.fill(f"user073_{self.timestamp}", f"pwdspace{self.timestamp}@test.com", spaced_pwd)
+        self.register_page.submit()
         
         self.wait_for_registration_result()
         page_source = self.driver.page_source.lower()
@@ -177,11 +142,9 @@ class AdvancedInputCaseTests(TestBase):
             return False
 
         # Attempting to log in with a password without spaces → Should succeed (indicating backend automatically trims spaces)
-        self.driver.get(LOGIN_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "email").send_keys(f"pwdspace{self.timestamp}@test.com")
-        self.driver.find_element(By.NAME, "password").send_keys("Test1234abcd")  
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.login_page.open()
+        self.login_page.fill(f"pwdspace{self.timestamp}@test.com", "Test1234abcd")
+        self.login_page.submit()
         
         self.wait_for_registration_result()
         page_source = self.driver.page_source.lower()
@@ -197,34 +160,29 @@ class AdvancedInputCaseTests(TestBase):
     #Test Case Name: Form State After Error
     def form_state_after_error(self):
         test_name = "REG-064 - Form State Retention After Validation Error"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
+        self.register_page.open()
 
         username = f"user074_{self.timestamp}"
         email = f"state{self.timestamp}@test.com"
 
-        self.driver.find_element(By.NAME, "username").send_keys(username)
-        self.driver.find_element(By.NAME, "email").send_keys(email)
-        self.driver.find_element(By.NAME, "password").send_keys("weak")  
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys("weak")
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.fill(username, email, "weak")
+        self.register_page.submit()
         self.wait_for_registration_result()
 
         # Resubmit after password reset
-        self.driver.find_element(By.NAME, "password").clear()
-        self.driver.find_element(By.NAME, "password").send_keys("again")
-        self.driver.find_element(By.NAME, "confirmPassword").clear()
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys("again")
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.element("password").clear()
+        self.register_page.element("password").send_keys("again")
+        self.register_page.element("confirmPassword").clear()
+        self.register_page.element("confirmPassword").send_keys("again")
+        self.register_page.submit()
         self.wait_for_registration_result()
 
         # Check whether the username and email address are reserved.
         try:
-            current_username = self.driver.find_element(By.NAME, "username").get_attribute("value")
-            current_email = self.driver.find_element(By.NAME, "email").get_attribute("value")
+            current_username = self.register_page.element("username").get_attribute("value")
+            current_email = self.register_page.element("email").get_attribute("value")
         except:
             current_username = ""
             current_email = ""
@@ -242,33 +200,25 @@ class AdvancedInputCaseTests(TestBase):
     #Test Case Name: Double-Click Register
     def double_click_register_button(self):
         test_name = "REG-066 - Double-Click Register Button Protection"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")))
+        self.register_page.open()
 
         email = f"double{self.timestamp}@test.com"
-        self.driver.find_element(By.NAME, "username").send_keys(f"user076_{self.timestamp}")
-        self.driver.find_element(By.NAME, "email").send_keys(email)
-        self.driver.find_element(By.NAME, "password").send_keys(self.test_password)
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys(self.test_password)
-        self.driver.find_element(By.ID, "form2Example3c").click()
+        self.register_page.fill(f"user076_{self.timestamp}", email, self.test_password)
 
-        submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        submit_btn = self.register_page.element("submit")
 
-        # Double-click quickly
+        # Double-click quickly; stamped like submit(), so the wait below only takes the response
+        mark_submit(self.driver)
+        self.submit_stamped = True
         ActionChains(self.driver).double_click(submit_btn).perform()
         self.wait_for_registration_result()
 
         # Verify that only one account has been created.
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "email").send_keys(email)
-        self.driver.find_element(By.NAME, "username").send_keys("duplicate_check")
-        self.driver.find_element(By.NAME, "password").send_keys(self.test_password)
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys(self.test_password)
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.open()
+        self.register_page.fill("duplicate_check", email, self.test_password)
+        self.register_page.submit()
         self.wait_for_registration_result()
 
         if "already been registered" in self.driver.page_source.lower():
@@ -283,58 +233,57 @@ class AdvancedInputCaseTests(TestBase):
     # Test Case Name: Concurrent registration with same email in two tabs
     def concurrent_same_email(self):
         test_name = "REG-067 - Concurrent registration with same email in two tabs"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
         email = f"race{self.timestamp}@test.com"
         password = self.test_password
 
-        # Open Tab A
+        # Tab B is a second browser from the pool: one WebDriver session runs its commands one at a time,
+        # in whichever tab is current, so two tabs of it can't submit side by side
         driver1 = self.driver
-        driver1.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-
-        # Open Tab B
-        driver1.execute_script("window.open('');")
-        self.switch_to_window(1)                     
-        driver2 = self.driver                         
-        driver2.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-
-        # Fill both forms with same email
-        driver1.find_element(By.NAME, "username").send_keys(f"user067A_{self.timestamp}")
-        driver1.find_element(By.NAME, "email").send_keys(email)
-        driver1.find_element(By.NAME, "password").send_keys(password)
-        driver1.find_element(By.NAME, "confirmPassword").send_keys(password)
-        driver1.find_element(By.ID, "form2Example3c").click()
-
-        driver2.find_element(By.NAME, "username").send_keys(f"user067B_{self.timestamp}")
-        driver2.find_element(By.NAME, "email").send_keys(email)
-        driver2.find_element(By.NAME, "password").send_keys(password)
-        driver2.find_element(By.NAME, "confirmPassword").send_keys(password)
-        driver2.find_element(By.ID, "form2Example3c").click()
-
-        # Click Register almost simultaneously
-        def click_submit(d):
-            d.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-
-        thread1 = threading.Thread(target=click_submit, args=(driver1,))
-        thread2 = threading.Thread(target=click_submit, args=(driver2,))
-        thread1.start()
-        thread2.start()
-        thread1.join()
-        thread2.join()
-
-        self.wait_for_registration_result()
-
-        # Count how many tabs show success
-        success_tabs = 0
-        if RS_URL in driver1.current_url or "sign in" in driver1.page_source.lower():
-            success_tabs += 1
-        
-        self.switch_to_window(1)                     
-        if RS_URL in self.driver.current_url or "sign in" in self.driver.page_source.lower():
-            success_tabs += 1
-        self.switch_to_window(0)                     
+        driver2 = driver_pool.lease()
+        try:
+            # Open Tab A and Tab B
+            for d in (driver1, driver2):
+                d.get(REGISTER_URL)
+                WebDriverWait(d, TIMEOUT).until(EC.presence_of_element_located((By.NAME, "email")))
+
+            # Fill both forms with same email
+            driver1.find_element(By.NAME, "username").send_keys(f"user067A_{self.timestamp}")
+            driver1.find_element(By.NAME, "email").send_keys(email)
+            driver1.find_element(By.NAME, "password").send_keys(password)
+            driver1.find_element(By.NAME, "confirmPassword").send_keys(password)
+            driver1.find_element(By.ID, "form2Example3c").click()
+
+            driver2.find_element(By.NAME, "username").send_keys(f"user067B_{self.timestamp}")
+            driver2.find_element(By.NAME, "email").send_keys(email)
+            driver2.find_element(By.NAME, "password").send_keys(password)
+            driver2.find_element(By.NAME, "confirmPassword").send_keys(password)
+            driver2.find_element(By.ID, "form2Example3c").click()
+
+            # Stamp both forms first, so each wait below only takes that tab's own response
+            for d in (driver1, driver2):
+                mark_submit(d)
+
+            # Click Register almost simultaneously
+            def click_submit(d):
+                d.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+            thread1 = threading.Thread(target=click_submit, args=(driver1,))
+            thread2 = threading.Thread(target=click_submit, args=(driver2,))
+            thread1.start()
+            thread2.start()
+            thread1.join()
+            thread2.join()
+
+            # Count how many tabs show success
+            success_tabs = 0
+            for d in (driver1, driver2):
+                wait_for_outcome(d, REGISTRATION_OUTCOME, TIMEOUT, stamped=True)
+                if RS_URL in d.current_url or "sign in" in d.page_source.lower():
+                    success_tabs += 1
+        finally:
+            driver_pool.release(driver2)
 
         # Expected: Only ONE tab succeeds
         if success_tabs != 1:
@@ -345,14 +294,9 @@ class AdvancedInputCaseTests(TestBase):
             return False                                     
 
         # Final verification: Try registering the same email again → must be rejected
-        self.driver.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-        self.driver.find_element(By.NAME, "email").send_keys(email)
-        self.driver.find_element(By.NAME, "username").send_keys("check_duplicate")
-        self.driver.find_element(By.NAME, "password").send_keys(password)
-        self.driver.find_element(By.NAME, "confirmPassword").send_keys(password)
-        self.driver.find_element(By.ID, "form2Example3c").click()
-        self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+        self.register_page.open()
+        self.register_page.fill("check_duplicate", email, password)
+        self.register_page.submit()
         self.wait_for_registration_result()
 
         if "already been registered" in self.driver.page_source.lower():
@@ -370,55 +314,56 @@ class AdvancedInputCaseTests(TestBase):
     # Test Case Name: Concurrent registration of different accounts in parallel tabs
     def concurrent_different_accounts(self):
         test_name = "REG-068 - Concurrent registration of different accounts in parallel tabs"
-        logger.info(f"Starting {test_name}")
+        self.start_test(test_name)
 
         email_a = f"para{self.timestamp}a@test.com"
         email_b = f"para{self.timestamp}b@test.com"
         password = self.test_password
 
+        # Tab B is a second pooled browser, as in REG-067
         driver1 = self.driver
-        driver1.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-
-        driver1.execute_script("window.open('');")
-        self.switch_to_window(1)
-        driver2 = self.driver
-        driver2.get(REGISTER_URL)
-        self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-
-        # Fill Tab A
-        driver1.find_element(By.NAME, "username").send_keys(f"user068A_{self.timestamp}")
-        driver1.find_element(By.NAME, "email").send_keys(email_a)
-        driver1.find_element(By.NAME, "password").send_keys(password)
-        driver1.find_element(By.NAME, "confirmPassword").send_keys(password)
-        driver1.find_element(By.ID, "form2Example3c").click()
-
-        # Fill Tab B
-        driver2.find_element(By.NAME, "username").send_keys(f"user068B_{self.timestamp}")
-        driver2.find_element(By.NAME, "email").send_keys(email_b)
-        driver2.find_element(By.NAME, "password").send_keys(password)
-        driver2.find_element(By.NAME, "confirmPassword").send_keys(password)
-        driver2.find_element(By.ID, "form2Example3c").click()
-
-        # Click both at the same time
-        def click_submit(d):
-            d.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-
-        t1 = threading.Thread(target=click_submit, args=(driver1,))
-        t2 = threading.Thread(target=click_submit, args=(driver2,))
-        t1.start()
-        t2.start()
-        t1.join()
-        t2.join()
-
-        time.sleep(3)
-        self.wait_for_registration_result()
-
-        self.switch_to_window(0)
-        success_a = RS_URL in self.driver.current_url or "sign in" in self.driver.page_source.lower()
-        self.switch_to_window(1)
-        success_b = RS_URL in self.driver.current_url or "sign in" in self.driver.page_source.lower()
-        self.switch_to_window(0)
+        driver2 = driver_pool.lease()
+        try:
+            for d in (driver1, driver2):
+                d.get(REGISTER_URL)
+                WebDriverWait(d, TIMEOUT).until(EC.presence_of_element_located((By.NAME, "email")))
+
+            # Fill Tab A
+            driver1.find_element(By.NAME, "username").send_keys(f"user068A_{self.timestamp}")
+            driver1.find_element(By.NAME, "email").send_keys(email_a)
+            driver1.find_element(By.NAME, "password").send_keys(password)
+            driver1.find_element(By.NAME, "confirmPassword").send_keys(password)
+            driver1.find_element(By.ID, "form2Example3c").click()
+
+            # Fill Tab B
+            driver2.find_element(By.NAME, "username").send_keys(f"user068B_{self.timestamp}")
+            driver2.find_element(By.NAME, "email").send_keys(email_b)
+            driver2.find_element(By.NAME, "password").send_keys(password)
+            driver2.find_element(By.NAME, "confirmPassword").send_keys(password)
+            driver2.find_element(By.ID, "form2Example3c").click()
+
+            for d in (driver1, driver2):
+                mark_submit(d)
+
+            # Click both at the same time
+            def click_submit(d):
+                d.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+
+            t1 = threading.Thread(target=click_submit, args=(driver1,))
+            t2 = threading.Thread(target=click_submit, args=(driver2,))
+            t1.start()
+            t2.start()
+            t1.join()
+            t2.join()
+
+            # Wait for each tab's own response instead of a fixed sleep
+            succeeded = []
+            for d in (driver1, driver2):
+                wait_for_outcome(d, REGISTRATION_OUTCOME, TIMEOUT, stamped=True)
+                succeeded.append(RS_URL in d.current_url or "sign in" in d.page_source.lower())
+            success_a, success_b = succeeded
+        finally:
+            driver_pool.release(driver2)
 
         if not (success_a and success_b):
             self.take_screenshot("REG068_ONE_OR_BOTH_FAILED")
@@ -430,14 +375,9 @@ class AdvancedInputCaseTests(TestBase):
         failed_count = 0
 
         for email in [email_a, email_b]:
-            self.driver.get(REGISTER_URL)
-            self.wait.until(EC.presence_of_element_located((By.NAME, "email")))
-            self.driver.find_element(By.NAME, "email").send_keys(email)
-            self.driver.find_element(By.NAME, "username").send_keys("dup_check")
-            self.driver.find_element(By.NAME, "password").send_keys(password)
-            self.driver.find_element(By.NAME, "confirmPassword").send_keys(password)
-            self.driver.find_element(By.ID, "form2Example3c").click()
-            self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+            self.register_page.open()
+            self.register_page.fill("dup_check", email, password)
+            self.register_page.submit()
             self.wait_for_registration_result()
 
             if "already been registered" not in self.driver.page_source.lower():
@@ -462,7 +402,6 @@ class AdvancedInputCaseTests(TestBase):
 
             self.email_with_spaces()
             self.email_case_handling()
-            self.bypass_frontend_validation()
             self.password_with_spaces()
             self.form_state_after_error()
             self.double_click_register_button()
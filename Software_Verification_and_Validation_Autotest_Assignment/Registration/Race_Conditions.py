@@ -0,0 +1,82 @@
+# Race_Conditions.py
+from test_base import HttpTestBase, logger
+from collections import Counter
+import http.client
+import time
+
+from race_harness import Racer, race, race_summary, wilson_interval, RACE_RACERS, RACE_REPEATS
+from .Backend_Validation import classify
+
+class RaceConditionTests(HttpTestBase):
+    def __init__(self):
+        super().__init__()
+        self.timestamp = int(time.time())
+        self.test_password = "Test1234abcd"
+
+    #Test Case ID: test_REG_067 (race)
+    #Test Case Name: Same-email registration race, N racers over independent connections, repeated K times
+    def same_email_race(self, racers=RACE_RACERS, repeats=RACE_REPEATS):
+        test_name = "REG-067/race - Same-email registration race (N-way)"
+        self.start_test(test_name, f"{racers} racers x {repeats} races")
+
+        stats, duplicates, no_winner, broken = [], [], [], []
+        for k in range(repeats):
+            email = f"race{self.timestamp}_{k}@test.com"
+            contenders = [Racer() for _ in range(racers)]
+            try:
+                for i, racer in enumerate(contenders):
+                    form = racer.load_form("/register.jsp", "email")
+                    racer.arm(form, {"username": f"r{self.timestamp % 100000}_{k}_{i}", "email": email,
+                                     "password": self.test_password, "confirmPassword": self.test_password},
+                              ("form2Example3c",))
+                stats.append(race(contenders))
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                logger.error(f"Race {k} could not be set up: {e}")
+                broken.append(email)
+                continue
+            finally:
+                for racer in contenders:
+                    racer.close()
+
+            outcomes = Counter("ERROR" if racer.error else classify(racer.response) for racer in contenders)
+            if outcomes["ACCEPTED"] > 1:
+                duplicates.append({"email": email, "accounts_created": outcomes["ACCEPTED"]})
+            elif outcomes["ACCEPTED"] == 0:
+                no_winner.append({"email": email, "outcomes": dict(outcomes)})
+            if outcomes["CRASH"] or outcomes["ERROR"]:
+                broken.append(email)
+
+        summary = race_summary(stats)
+        low, high = wilson_interval(len(duplicates), len(stats))
+        details = {**summary, "racers": racers, "duplicates": duplicates, "no_winner": no_winner, "errors": broken,
+                   "duplicate_probability": round(len(duplicates) / len(stats), 4) if stats else None,
+                   "duplicate_probability_95ci": [round(low, 4), round(high, 4)]}
+        timing = (f"send skew p50 {summary['send_skew_ms_p50']} ms, max {summary['send_skew_ms_max']} ms, "
+                  f"response spread p50 {summary['response_spread_ms_p50']} ms")
+
+        if duplicates:
+            details["severity"] = "CRITICAL"
+            self.log_test_result(test_name, "FAIL",
+                f"Duplicate accounts in {len(duplicates)}/{len(stats)} races "
+                f"(P(duplicate) ≈ {len(duplicates) / len(stats):.1%}, 95% CI {low:.1%}-{high:.1%}); {timing}", details)
+            return False
+        if broken or no_winner:
+            details["severity"] = "HIGH"
+            self.log_test_result(test_name, "FAIL",
+                f"{len(broken)} races crashed/errored, {len(no_winner)} races had no winner; {timing}", details)
+            return False
+        self.log_test_result(test_name, "PASS",
+            f"Exactly one account in each of {len(stats)} races of {racers} "
+            f"(P(duplicate) < {high:.1%} at 95%); {timing}", details)
+        return True
+
+    def run_all_race_tests(self):
+        logger.info("\n" + "="*70)
+        logger.info("STARTING REGISTRATION RACE TESTS (HTTP): REG-067")
+        logger.info("="*70)
+
+        self.same_email_race()
+
+        logger.info("="*70)
+        logger.info("REGISTRATION RACE TEST SUITE COMPLETED")
+        logger.info("="*70)
@@ -2,7 +2,8 @@
 from .Email_Validation import EmailValidationTests
 from .Input_Normalization_Robustness import AdvancedInputCaseTests
 from .Password_Length_Boundary import PasswordLengthBoundaryTest
-from .RF_BV import BoundaryAndSpecialInputTests
+from .Backend_Validation import BackendValidationTests
+from .Race_Conditions import RaceConditionTests
 from test_base import TestBase, logger
 
 class RegistrationTests(TestBase):
@@ -11,25 +12,21 @@ class RegistrationTests(TestBase):
         self.email_tests = EmailValidationTests()
         self.input_tests = AdvancedInputCaseTests()
         self.password_tests = PasswordLengthBoundaryTest()
-        self.rf_bv_tests = BoundaryAndSpecialInputTests()
+        self.backend_tests = BackendValidationTests()
+        self.race_tests = RaceConditionTests()
 
     def run_all_registration_tests(self):
-        if not self.setup():
-            return
+        logger.info("\n" + "="*80)
+        logger.info("STARTING FULL REGISTRATION TEST SUITE")
+        logger.info("="*80)
 
-        try:
-            logger.info("\n" + "="*80)
-            logger.info("STARTING FULL REGISTRATION TEST SUITE")
-            logger.info("="*80)
+        self.email_tests.run_all_email_tests()
+        self.input_tests.run_all_inputNR_tests()
+        self.password_tests.run_all_password_tests()
+        # REG-014/016/020/021/062 run over HTTP here; their browser runs are opt-in (--select ui-only)
+        self.backend_tests.run_all_backend_tests()
+        self.race_tests.run_all_race_tests()
 
-            self.email_tests.run_all_email_tests()
-            self.input_tests.run_all_inputNR_tests()
-            self.password_tests.run_all_password_tests()
-            self.rf_bv_tests.run_all_RF_BV_tests()
-
-            logger.info("="*80)
-            logger.info("FULL REGISTRATION TEST SUITE COMPLETED")
-            logger.info("="*80)
-
-        finally:
-            self.teardown()
\ No newline at end of file
+        logger.info("="*80)
+        logger.info("FULL REGISTRATION TEST SUITE COMPLETED")
+        logger.info("="*80)
\ No newline at end of file
@@ -0,0 +1,83 @@
+# adaptive_timeouts.py
+import os
+import json
+import atexit
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+TIMEOUTS_FILE = os.environ.get("AUTOTEST_TIMEOUTS_FILE", "adaptive_timeouts.json")
+WINDOW = 200            # rolling window of samples kept per page/action
+MIN_SAMPLES = 20        # below this the fixed default is used
+MARGIN = 1.5            # timeout = p99 * MARGIN + PADDING
+PADDING = 0.5
+MIN_TIMEOUT = 1.0
+
+class AdaptiveTimeouts:
+    def __init__(self, path=TIMEOUTS_FILE):
+        self.path = path
+        self._samples = {}
+        self._new = {}          # samples observed by this process, merged into the file on save
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, samples in stored.items():
+            self._samples[key] = deque(samples, maxlen=WINDOW)
+
+    def record(self, key, seconds):
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=WINDOW)).append(round(seconds, 3))
+            self._new.setdefault(key, []).append(round(seconds, 3))
+
+    def record_censored(self, key, seconds):
+        # A wait that timed out after `seconds`: the response took at least that long. It counts as at most
+        # p99 * MARGIN, so a run of misses widens the timeout step by step instead of jumping to the clamp.
+        p99 = self.p99(key)
+        self.record(key, seconds if p99 is None else min(seconds, p99 * MARGIN))
+
+    def p99(self, key):
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+    def timeout(self, key, default):
+        p99 = self.p99(key)
+        if p99 is None:
+            return default
+        # Never wait longer than the fixed default; only cut the time wasted on markerless cases
+        return min(default, max(MIN_TIMEOUT, p99 * MARGIN + PADDING))
+
+    def save(self):
+        with self._lock:
+            new, self._new = self._new, {}
+        if not new:
+            return
+        # Re-read so samples saved meanwhile by other worker processes are kept
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            stored = {}
+        for key, samples in new.items():
+            stored[key] = (stored.get(key, []) + samples)[-WINDOW:]
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stored, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save adaptive timeouts: {e}")
+
+adaptive_timeouts = AdaptiveTimeouts()
+atexit.register(adaptive_timeouts.save)
@@ -0,0 +1,120 @@
+# artifact_store.py
+import io
+import os
+import re
+import json
+import hashlib
+import logging
+from datetime import datetime
+
+try:
+    from PIL import Image
+except ImportError:   # Pillow is optional: only needed for near-duplicate collapsing
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_ROOT = "screenshots"
+# Collapse screenshots whose perceptual hashes differ in at most this many bits (0 = exact only)
+PHASH_DISTANCE = int(os.environ.get("AUTOTEST_PHASH_DISTANCE", "0"))
+# Perceptual hashes of stored objects, next to the objects: one {"hash", "phash"} line per object, appended by
+# every process, so near-duplicates are found across parallel workers and earlier runs
+PHASH_INDEX = "phashes.jsonl"
+
+TEST_ID_PATTERN = re.compile(r"(?<![A-Za-z])(REG|LGN)-?(\d{3})")
+
+def split_name(name):
+    # "FAIL_REG-030 - Password Length..." / "REG030_FAIL_length_26" -> ("REG-030", "fail_password_length...")
+    match = TEST_ID_PATTERN.search(name)
+    test_id = f"{match.group(1)}-{match.group(2)}" if match else "UNKNOWN"
+    rest = TEST_ID_PATTERN.sub("", name, count=1) if match else name
+    step = re.sub(r"[^a-z0-9]+", "_", rest.encode("ascii", "ignore").decode().lower()).strip("_")
+    return test_id, step or "screenshot"
+
+def perceptual_hash(png):
+    # 64-bit difference hash: compare each pixel of a 9x8 grayscale thumbnail with its right neighbour
+    image = Image.open(io.BytesIO(png)).convert("L").resize((9, 8))
+    pixels = list(image.getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits
+
+class ArtifactStore:
+    def __init__(self, root=ARTIFACT_ROOT, phash_distance=PHASH_DISTANCE):
+        self.root = root
+        self.phash_distance = phash_distance if Image is not None else 0
+        self._phashes = {}      # content hash -> perceptual hash, for near-duplicate lookup
+        self._phash_offset = 0  # bytes of the shared perceptual-hash index read so far
+
+    def object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.png")
+
+    def phash_index_path(self):
+        return os.path.join(self.root, "objects", PHASH_INDEX)
+
+    def _load_phashes(self):
+        # Picks up the hashes appended since the last read, by this or any other process
+        try:
+            with open(self.phash_index_path(), "rb") as f:
+                f.seek(self._phash_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        complete = data.rfind(b"\n") + 1     # a line still being written is read next time
+        for line in data[:complete].splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                self._phashes[entry["hash"]] = int(entry["phash"], 16)
+        self._phash_offset += complete
+
+    def _remember_phash(self, digest, phash):
+        self._phashes[digest] = phash
+        # One short append per object: whole lines, even with several workers appending at once
+        with open(self.phash_index_path(), "ab") as f:
+            f.write((json.dumps({"hash": digest, "phash": f"{phash:016x}"}) + "\n").encode("utf-8"))
+
+    def _near_duplicate(self, png):
+        self._load_phashes()
+        phash = perceptual_hash(png)
+        for digest, known in self._phashes.items():
+            if bin(phash ^ known).count("1") <= self.phash_distance:
+                return digest, phash
+        return None, phash
+
+    def put(self, run_folder, name, png):
+        digest = hashlib.sha256(png).hexdigest()
+        path = self.object_path(digest)
+        stored = "duplicate"
+
+        if not os.path.exists(path):
+            near, phash = self._near_duplicate(png) if self.phash_distance else (None, None)
+            if near:
+                digest, path, stored = near, self.object_path(near), "near-duplicate"
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Write then rename so parallel workers never see a half-written object
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(png)
+                os.replace(tmp_path, path)
+                stored = "new"
+                if phash is not None:
+                    self._remember_phash(digest, phash)
+
+        test_id, step = split_name(name)
+        self._index(run_folder, {
+            "test_id": test_id, "step": step, "name": name, "hash": digest,
+            "object": os.path.relpath(path, run_folder), "stored": stored,
+            "timestamp": datetime.now().isoformat()
+        })
+        logger.info(f"Screenshot {test_id}/{step} -> {path} ({stored})")
+        return path
+
+    def _index(self, run_folder, entry):
+        os.makedirs(run_folder, exist_ok=True)
+        with open(os.path.join(run_folder, "index.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+artifact_store = ArtifactStore()
@@ -1,20 +1,209 @@
 # auto_test.py
-from Registration.registration_tests import RegistrationTests
-from Login.login_tests import LoginTests
-from test_base import logger
+import os
+import json
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util
+from urllib.parse import urlsplit
+from datetime import datetime
+from result_collector import ResultCollector
+from case_tables import row_ids
+from registry import REGISTRY, TAGS, TEST_NAME_PATTERN, select, jobs as plan_jobs, row_jobs, waves, load_suite
+
+# Only light modules are imported up here: suites, Selenium and the browser pool are imported
+# inside the functions that run tests, so --list and planning start instantly.
+
+def start_standin():
+    # Serve the stand-in app on the address the suites already point at (AUTOTEST_BASE_URL)
+    from standin_server import StandInServer
+    from pages import BASE_URL
+    url = urlsplit(BASE_URL)
+    # Tells worker processes to use a stand-in scope of their own (see init_worker)
+    os.environ["AUTOTEST_STANDIN_URL"] = BASE_URL
+    return StandInServer(url.hostname, url.port or 80).start()
+
+def report_entries(report_path):
+    # Either a FINAL_REPORT_*.json or the RESULTS_*.jsonl stream of a run that never finished
+    if report_path.endswith(".jsonl"):
+        return list(ResultCollector(report_path).entries())
+    with open(report_path, encoding="utf-8") as f:
+        return json.load(f)["test_cases"]
+
+def failed_jobs(report_path, failed_rows_only=False):
+    failed = {}         # test ID -> failing row ids, or None to rerun the whole test
+    for entry in report_entries(report_path):
+        if entry["status"] == "PASS":
+            continue
+        match = TEST_NAME_PATTERN.match(entry["name"])
+        if not match or match["test_id"] not in REGISTRY:
+            print(f"No registered test for report entry, skipping: {entry['name']}")
+            continue
+        if (failed_rows_only and match["row"] and REGISTRY[match["test_id"]]["table"]
+                and failed.get(match["test_id"], set()) is not None):
+            failed.setdefault(match["test_id"], set()).add(match["row"])
+        else:
+            failed[match["test_id"]] = None
+
+    jobs = []
+    for test_id, rows in failed.items():
+        jobs.extend(plan_jobs([REGISTRY[test_id]]) if rows is None else row_jobs(REGISTRY[test_id], rows))
+    return jobs
+
+def list_tests(tests):
+    for test in tests:
+        rows = f"{len(row_ids(test['table']))} rows" if test["table"] else ""
+        resources = "".join(f"  {name} ({mode})" for name, mode in test["resources"].items())
+        print(f"{test['id']:<14}{rows:<9}{test['title']}  [{', '.join(test['tags'])}]{resources}")
+    print(f"\n{len(tests)} tests, {len(plan_jobs(tests))} jobs. Tags: {', '.join(TAGS)}")
+
+def list_waves(tests, workers):
+    schedule = waves(plan_jobs(tests), workers)
+    for number, wave in enumerate(schedule, 1):
+        print(f"Wave {number:<4}{len(wave):>3} jobs: {', '.join(case[0] for case in wave)}")
+    print(f"\n{len(plan_jobs(tests))} jobs in {len(schedule)} waves on {workers} workers")
+
+def run_jobs(jobs, workers=1, headless=False, title="Selected tests"):
+    from test_base import TestBase, logger
+    from driver_pool import driver_pool
 
-def auto_test():
     logger.info("="*80)
-    logger.info("Starting Full Test: Register to Login to Security")
+    logger.info(f"{title}: {len(jobs)} jobs")
     logger.info("="*80)
+    if not jobs:
+        return
+    if workers > 1:
+        auto_test_parallel(workers, headless, jobs)
+        return
+    for case in jobs:
+        run_case(case, headless)
+    TestBase().generate_report(final=True)
+    driver_pool.shutdown()
+
+def rerun_failed(report_path, workers=1, headless=False, failed_rows_only=False):
+    run_jobs(failed_jobs(report_path, failed_rows_only), workers, headless, f"Re-running failed tests from {report_path}")
+
+def auto_test(headless=False):
+    # The same registry plan --workers runs, one job after another in this process
+    run_jobs(plan_jobs(select()), 1, headless, "Starting Full Test: Register to Login to Security")
 
-    reg = RegistrationTests()
-    reg.run_all_registration_tests()
+def fuzz_emails(count, seed):
+    from Registration.Email_Fuzzing import EmailFuzzTests
+    fuzz = EmailFuzzTests()
+    fuzz.run_all_fuzz_tests(count=count, seed=seed)
+    fuzz.generate_report(final=True)
 
-    login = LoginTests()
-    login.run_all_login_tests()
+def init_worker():
+    # Worker processes skip atexit handlers, so close the worker's browsers, drain its
+    # pending screenshots and save its response-time samples via multiprocessing finalizers
+    if os.environ.get("AUTOTEST_STANDIN_URL"):
+        # Private stand-in state per worker; set before anything imports pages and reads the base URL
+        from standin_server import SCOPE_PREFIX
+        os.environ["AUTOTEST_BASE_URL"] = f"{os.environ['AUTOTEST_STANDIN_URL']}{SCOPE_PREFIX}w{os.getpid()}"
+    from driver_pool import driver_pool
+    from screenshot_writer import screenshot_writer
+    from adaptive_timeouts import adaptive_timeouts
+    util.Finalize(None, driver_pool.shutdown, exitpriority=10)
+    util.Finalize(None, screenshot_writer.shutdown, exitpriority=10)
+    util.Finalize(None, adaptive_timeouts.save, exitpriority=10)
 
-    reg.generate_report(final=True)
+def run_case(case, headless=False):
+    # Results go straight to the shared results stream, nothing is shipped back to the parent
+    test_id, module_name, class_name, methods, rows = case
+
+    suite = load_suite(module_name, class_name)()
+    if not suite.setup(headless):
+        suite.log_test_result(test_id, "ERROR", "WebDriver could not be started in worker")
+        return
+
+    try:
+        for method in methods:
+            if rows is None:
+                getattr(suite, method)()
+            else:
+                getattr(suite, method)(rows=rows)
+    except Exception as e:
+        suite.log_test_result(test_id, "ERROR", f"Unhandled exception in worker: {e}")
+    finally:
+        suite.teardown()
+
+def auto_test_parallel(workers, headless=False, jobs=None):
+    from test_base import TestBase, logger, collector
+    if jobs is None:
+        jobs = plan_jobs(select())
+    # Tests sharing an account or the lockout counters never run side by side: each wave only holds
+    # jobs whose declared resources don't conflict, and a wave starts once the previous one has finished
+    schedule = waves(jobs, workers)
+    logger.info("="*80)
+    logger.info(f"Starting Full Test in parallel: {len(jobs)} jobs in {len(schedule)} waves on {workers} workers")
+    logger.info("="*80)
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=init_worker) as executor:
+        for number, wave in enumerate(schedule, 1):
+            logger.info(f"Wave {number}/{len(schedule)}: {', '.join(case[0] for case in wave)}")
+            futures = [(case, executor.submit(run_case, case, headless)) for case in wave]
+            for case, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Worker crashed while running {case[0]}: {e}")
+                    collector.record(case[0], "ERROR", f"Worker crashed: {e}")
+
+    TestBase().generate_report(final=True)
 
 if __name__ == "__main__":
-    auto_test()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Register/Login automated test suite")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="run individual test cases across N browser worker processes")
+    parser.add_argument("--headless", action="store_true", help="run worker browsers headless")
+    parser.add_argument("--standin", action="store_true",
+                        help="run against a fresh in-process stand-in app instead of the real server")
+    parser.add_argument("--fuzz-emails", type=int, metavar="N",
+                        help="instead of the suite, fuzz registration with N generated email addresses over HTTP")
+    parser.add_argument("--fuzz-seed", type=int, default=0, help="seed for --fuzz-emails (same seed, same addresses)")
+    parser.add_argument("--rerun-failed", metavar="REPORT",
+                        help="run only the tests that did not pass in a FINAL_REPORT_*.json or RESULTS_*.jsonl")
+    parser.add_argument("--failed-rows-only", action="store_true",
+                        help="with --rerun-failed, rerun only the failing rows of data-driven tests")
+    parser.add_argument("--select", nargs="+", metavar="ID_OR_TAG",
+                        help="run only these test IDs, ID globs (REG-0*) or tags (security, concurrency, ...)")
+    parser.add_argument("--list", action="store_true", help="list the (selected) tests and exit without running anything")
+    parser.add_argument("--waves", action="store_true",
+                        help="show how the (selected) tests would be packed into parallel waves for --workers and exit")
+    parser.add_argument("--timeline", action="store_true",
+                        help="time every WebDriver command, page action and wait; export a trace and a per-step summary")
+    args = parser.parse_args()
+
+    try:
+        selected = select(args.select)
+    except KeyError as e:
+        parser.error(e.args[0])
+    if args.list:
+        list_tests(selected)
+        raise SystemExit(0)
+    if args.waves:
+        list_waves(selected, max(args.workers, 1))
+        raise SystemExit(0)
+
+    if args.timeline:
+        # Before any suite module is imported; worker processes inherit it
+        os.environ["AUTOTEST_TIMELINE"] = "1"
+    # One results stream for the whole run: workers inherit the path and append to the same file
+    os.environ.setdefault("AUTOTEST_RESULTS_STREAM", f"RESULTS_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+    standin = start_standin() if args.standin else None
+    try:
+        if args.fuzz_emails:
+            fuzz_emails(args.fuzz_emails, args.fuzz_seed)
+        elif args.rerun_failed:
+            rerun_failed(args.rerun_failed, args.workers, args.headless, args.failed_rows_only)
+        elif args.select:
+            run_jobs(plan_jobs(selected), args.workers, args.headless, f"Running {' '.join(args.select)}")
+        elif args.workers > 1:
+            auto_test_parallel(args.workers, args.headless)
+        else:
+            auto_test(args.headless)
+    finally:
+        if standin:
+            standin.stop()
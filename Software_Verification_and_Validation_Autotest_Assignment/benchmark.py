@@ -0,0 +1,285 @@
+# benchmark.py
+import os
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+from standin_server import StandInServer, SEED_ACCOUNTS
+from timeline import percentile
+
+logger = logging.getLogger(__name__)
+
+# Measures what the harness itself costs: representative flows run against an in-process stand-in with
+# zero latency and no faults, and the server's own handling time is subtracted from every iteration, so
+# what is left is harness + browser + loopback time. Results are kept per version for comparison.
+BENCH_DIR = os.environ.get("AUTOTEST_BENCH_DIR", "benchmarks")
+BROWSER_ITERATIONS = int(os.environ.get("AUTOTEST_BENCH_ITERATIONS", "20"))
+HTTP_ITERATIONS = int(os.environ.get("AUTOTEST_BENCH_HTTP_ITERATIONS", "200"))
+WARMUP = 2                  # iterations run first and discarded (page cache, JIT, pooled connections)
+WARM_LEASES = 5
+REGRESSION_RATIO = float(os.environ.get("AUTOTEST_BENCH_REGRESSION", "1.25"))   # p50 overhead growth that fails
+REGRESSION_MIN_MS = 2.0     # smaller growth is noise, whatever the ratio
+ADMIN_EMAIL, (_, ADMIN_PASSWORD) = next(iter(SEED_ACCOUNTS.items()))
+PASSWORD = "Bench1234abcd"
+
+def register_flow(test, n):
+    test.start_test("BENCH - Registration fill+submit")
+    test.register_page.open()
+    test.register_page.fill(f"bench{n}", f"bench_reg_{n}@test.com", PASSWORD)
+    test.register_page.submit()
+    test.wait_for_registration_result()
+    test.log_test_result("BENCH - Registration fill+submit", "PASS", "benchmark iteration")
+
+def login_flow(test, n):
+    test.start_test("BENCH - Login")
+    test.login_page.open()
+    test.login_page.fill(ADMIN_EMAIL, ADMIN_PASSWORD)
+    test.login_page.submit()
+    test.wait_for_login_result()
+    test.log_test_result("BENCH - Login", "PASS", "benchmark iteration")
+
+def lockout_account(n):
+    # Untimed: every iteration locks out a fresh account
+    from http_client import HttpClient
+    HttpClient().register(f"benchlock{n}", f"bench_lock_{n}@test.com", PASSWORD)
+
+def lockout_flow(test, n):
+    from test_base import LOCKOUT_THRESHOLD
+    test.start_test("BENCH - Lockout loop")
+    test.login_page.open()
+    for _ in range(LOCKOUT_THRESHOLD + 1):
+        test.login_page.fill(f"bench_lock_{n}@test.com", "wrongpass123", clear=True)
+        test.login_page.submit()
+        test.wait_for_login_result()
+    test.log_test_result("BENCH - Lockout loop", "PASS", "benchmark iteration")
+
+def tabs_flow(test, n):
+    test.start_test("BENCH - Concurrent tabs")
+    driver = test.driver
+    test.register_page.open()
+    test.register_page.fill(f"benchA{n}", f"bench_tab_{n}a@test.com", PASSWORD)
+    driver.execute_script("window.open('');")
+    first, second = driver.window_handles[:2]
+    driver.switch_to.window(second)
+    test.register_page.open()
+    test.register_page.fill(f"benchB{n}", f"bench_tab_{n}b@test.com", PASSWORD)
+    test.register_page.submit()
+    driver.switch_to.window(first)
+    test.register_page.invalidate()
+    test.register_page.submit()
+
+    # Both documents were stamped on submit, so both waits can use the stamp
+    for handle in (first, second):
+        driver.switch_to.window(handle)
+        test.submit_stamped = True
+        test.wait_for_registration_result()
+    driver.close()
+    driver.switch_to.window(first)
+    test.log_test_result("BENCH - Concurrent tabs", "PASS", "benchmark iteration")
+
+def register_http_flow(test, n):
+    from http_client import HttpClient
+    test.start_test("BENCH - Registration (HTTP)")
+    HttpClient().register(f"benchh{n}", f"bench_http_{n}@test.com", PASSWORD)
+    test.log_test_result("BENCH - Registration (HTTP)", "PASS", "benchmark iteration")
+
+def login_http_flow(test, n):
+    from http_client import HttpClient
+    test.start_test("BENCH - Login (HTTP)")
+    HttpClient().login(ADMIN_EMAIL, ADMIN_PASSWORD)
+    test.log_test_result("BENCH - Login (HTTP)", "PASS", "benchmark iteration")
+
+# (name, needs a browser, untimed preparation, timed flow)
+CASES = [
+    ("registration", True, None, register_flow),
+    ("login", True, None, login_flow),
+    ("lockout-loop", True, lockout_account, lockout_flow),
+    ("concurrent-tabs", True, None, tabs_flow),
+    ("registration/http", False, None, register_http_flow),
+    ("login/http", False, None, login_http_flow),
+]
+
+def harness_version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def summarize(walls, server_times, requests):
+    wall_ms = sorted(wall * 1000 for wall in walls)
+    overhead_ms = sorted((wall - busy) * 1000 for wall, busy in zip(walls, server_times))
+    return {
+        "iterations": len(walls),
+        "wall_ms": {"mean": round(sum(wall_ms) / len(wall_ms), 3), "p50": round(percentile(wall_ms, 0.5), 3),
+                    "p95": round(percentile(wall_ms, 0.95), 3), "min": round(wall_ms[0], 3)},
+        "overhead_ms": {"mean": round(sum(overhead_ms) / len(overhead_ms), 3),
+                        "p50": round(percentile(overhead_ms, 0.5), 3), "p95": round(percentile(overhead_ms, 0.95), 3)},
+        "server_ms_mean": round(sum(server_times) * 1000 / len(server_times), 3),
+        "requests_per_case": round(sum(requests) / len(requests), 1),
+        "throughput_per_s": round(len(walls) / sum(walls), 2),
+    }
+
+def measure(server, test, prepare, flow, iterations):
+    walls, server_times, requests = [], [], []
+    # Console output depends on the terminal, not the harness; keep it out of the measurement
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.WARNING)
+    try:
+        for n in range(WARMUP + iterations):
+            if prepare:
+                prepare(n)
+            served, busy = server.stats()
+            start = time.perf_counter()
+            flow(test, n)
+            wall = time.perf_counter() - start
+            served_after, busy_after = server.stats()
+            if n >= WARMUP:
+                walls.append(wall)
+                server_times.append(busy_after - busy)
+                requests.append(served_after - served)
+    finally:
+        root.setLevel(level)
+    return summarize(walls, server_times, requests)
+
+def run_benchmarks(server, names, headless=True, iterations=None, http_iterations=None):
+    results = {"startup": {}, "cases": {}}
+
+    start = time.perf_counter()
+    from test_base import TestBase, HttpTestBase
+    from driver_pool import driver_pool
+    results["startup"]["import_s"] = round(time.perf_counter() - start, 3)
+
+    browser = None
+    if any(needs_browser for name, needs_browser, _, _ in CASES if name in names):
+        browser = TestBase()
+        start = time.perf_counter()
+        if browser.setup(headless):
+            results["startup"]["driver_cold_s"] = round(time.perf_counter() - start, 3)
+            # Lease cycle of a warm pooled browser (reset + health check), paid by every case
+            cycles = []
+            for _ in range(WARM_LEASES):
+                start = time.perf_counter()
+                browser.teardown()
+                browser.setup(headless)
+                cycles.append(time.perf_counter() - start)
+            results["startup"]["warm_lease_ms"] = round(sum(cycles) * 1000 / len(cycles), 3)
+        else:
+            logger.warning("No browser could be started; browser cases are skipped")
+            browser = None
+
+    http = HttpTestBase()
+    for name, needs_browser, prepare, flow in CASES:
+        if name not in names:
+            continue
+        if needs_browser and browser is None:
+            results["cases"][name] = {"skipped": "no browser"}
+            continue
+        logger.info(f"Benchmarking {name}")
+        try:
+            results["cases"][name] = measure(server, browser if needs_browser else http, prepare, flow,
+                                             (iterations or BROWSER_ITERATIONS) if needs_browser
+                                             else (http_iterations or HTTP_ITERATIONS))
+        except Exception as e:
+            logger.error(f"Benchmark {name} failed: {e}")
+            results["cases"][name] = {"skipped": f"failed: {e}"}
+
+    if browser:
+        browser.teardown()
+    driver_pool.shutdown()
+    return results
+
+def log_results(results):
+    startup = results["startup"]
+    logger.info("\n" + "="*70)
+    logger.info(f"           HARNESS OVERHEAD BENCHMARK ({results['version']})")
+    logger.info("="*70)
+    logger.info(f"Import harness   : {startup['import_s']:.3f}s")
+    if "driver_cold_s" in startup:
+        logger.info(f"Cold browser     : {startup['driver_cold_s']:.3f}s")
+        logger.info(f"Warm lease cycle : {startup['warm_lease_ms']:.1f}ms")
+    logger.info(f"  {'case':<20} {'n':>5} {'wall p50':>9} {'wall p95':>9} {'server':>8} {'overhead p50':>13} {'cases/s':>8}")
+    for name, case in results["cases"].items():
+        if "skipped" in case:
+            logger.info(f"  {name:<20} skipped ({case['skipped']})")
+            continue
+        logger.info(f"  {name:<20} {case['iterations']:>5} {case['wall_ms']['p50']:>9.1f} {case['wall_ms']['p95']:>9.1f} "
+                    f"{case['server_ms_mean']:>8.1f} {case['overhead_ms']['p50']:>13.1f} {case['throughput_per_s']:>8.1f}")
+
+def previous_result(exclude):
+    files = [path for path in sorted(glob.glob(os.path.join(BENCH_DIR, "BENCH_*.json")))
+             if os.path.abspath(path) != os.path.abspath(exclude)]
+    return files[-1] if files else None
+
+def compare(results, baseline_path):
+    # Returns the cases whose p50 overhead grew past the regression threshold
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    logger.info(f"\nCompared with {baseline_path} ({baseline.get('version', 'unknown')}):")
+    regressions = []
+    for name, case in results["cases"].items():
+        before = baseline["cases"].get(name, {})
+        if "overhead_ms" not in case or "overhead_ms" not in before:
+            continue
+        old, new = before["overhead_ms"]["p50"], case["overhead_ms"]["p50"]
+        regressed = new > old * REGRESSION_RATIO and new - old > REGRESSION_MIN_MS
+        change = f"{(new - old) / old:+.0%}" if old > 0 else "n/a"
+        logger.info(f"  {name:<20} {old:>9.1f}ms -> {new:>9.1f}ms ({change}){'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Measure the time the test harness itself adds per case")
+    parser.add_argument("--cases", nargs="+", choices=[name for name, _, _, _ in CASES],
+                        default=[name for name, _, _, _ in CASES], help="benchmark only these flows")
+    parser.add_argument("--iterations", type=int, help=f"browser iterations per case (default {BROWSER_ITERATIONS})")
+    parser.add_argument("--http-iterations", type=int, help=f"HTTP iterations per case (default {HTTP_ITERATIONS})")
+    parser.add_argument("--headed", action="store_true", help="run the browser with a window")
+    parser.add_argument("--compare", metavar="BENCH_JSON",
+                        help="baseline to compare with (default: the latest result in the benchmark directory)")
+    args = parser.parse_args()
+
+    # Zero latency, no faults; the harness is pointed at it before any harness module is imported
+    server = StandInServer(latency=0, fault_rate=0).start()
+    scratch = tempfile.mkdtemp(prefix="autotest_bench_")
+    os.environ["AUTOTEST_BASE_URL"] = server.base_url
+    os.environ["AUTOTEST_RESULTS_STREAM"] = os.path.join(scratch, "results.jsonl")
+    os.environ["AUTOTEST_TIMEOUTS_FILE"] = os.path.join(scratch, "adaptive_timeouts.json")
+    try:
+        results = run_benchmarks(server, args.cases, not args.headed, args.iterations, args.http_iterations)
+    finally:
+        server.stop()
+
+    results.update({
+        "version": harness_version(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fill_mode": os.environ.get("AUTOTEST_FILL_MODE", "typing"),
+        "headless": not args.headed,
+    })
+    log_results(results)
+
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    result_file = os.path.join(BENCH_DIR, f"BENCH_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    logger.info(f"\nBenchmark saved: {result_file}")
+
+    baseline = args.compare or previous_result(result_file)
+    regressions = compare(results, baseline) if baseline else []
+    if regressions:
+        logger.error(f"Harness overhead regressed by more than {REGRESSION_RATIO - 1:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# case_tables.py
+import os
+import json
+from functools import lru_cache
+
+# One JSON file per data-driven test ID: {"test_id", "description", "rows": [{"id": ..., <inputs>}]}
+CASES_DIR = os.environ.get("AUTOTEST_CASES_DIR",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), "cases"))
+
+def expand(value):
+    # {"repeat": "a", "times": 200, "suffix": "@x.com"} keeps long boundary inputs readable in the file
+    if isinstance(value, dict) and "repeat" in value:
+        return value.get("prefix", "") + value["repeat"] * value["times"] + value.get("suffix", "")
+    return value
+
+def table_path(test_id):
+    return os.path.join(CASES_DIR, f"{test_id}.json")
+
+def has_table(test_id):
+    return os.path.exists(table_path(test_id))
+
+@lru_cache(maxsize=None)
+def _load(test_id):
+    with open(table_path(test_id), encoding="utf-8") as f:
+        table = json.load(f)
+
+    rows = []
+    for index, row in enumerate(table["rows"]):
+        row = {key: expand(value) for key, value in row.items()}
+        row.setdefault("id", str(index))
+        rows.append(row)
+
+    ids = [row["id"] for row in rows]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"Duplicate row ids in {table_path(test_id)}")
+    return tuple(rows)
+
+def row_ids(test_id):
+    return [row["id"] for row in _load(test_id)]
+
+def load_table(test_id, rows=None):
+    # rows: optional row ids to keep (one fanned-out job, or a rerun of failed rows)
+    table = _load(test_id)
+    if rows is None:
+        return [dict(row) for row in table]
+    unknown = set(rows) - {row["id"] for row in table}
+    if unknown:
+        raise KeyError(f"Unknown rows for {test_id}: {sorted(unknown)}")
+    return [dict(row) for row in table if row["id"] in rows]
+
+def row_name(test_name, row):
+    # Per-row result name, e.g. "REG-020 - Invalid Email Formats [double-at]"
+    return f"{test_name} [{row['id']}]"
@@ -0,0 +1,122 @@
+# driver_pool.py
+import os
+import atexit
+import logging
+import threading
+from selenium import webdriver
+from timeline import timeline
+
+logger = logging.getLogger(__name__)
+
+# Number of warm browsers kept alive between leases (override with AUTOTEST_POOL_SIZE)
+POOL_SIZE = int(os.environ.get("AUTOTEST_POOL_SIZE", "2"))
+
+class DriverPool:
+    def __init__(self, size=POOL_SIZE):
+        self.size = size
+        self._idle = []          # [(headless, driver)] ready to be leased
+        self._leased = {}        # id(driver) -> (headless, driver)
+        self._lock = threading.Lock()
+
+    def _create(self, headless):
+        options = webdriver.ChromeOptions()
+        options.add_argument('--start-maximized')
+        if headless:
+            options.add_argument('--headless')
+        with timeline.span("driver start", "fixture"):
+            driver = timeline.instrument(webdriver.Chrome(options=options))
+        logger.info(f"WebDriver started (pool: {len(self._leased) + len(self._idle) + 1} alive)")
+        return driver
+
+    def _is_healthy(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"WebDriver quit failed: {e}")
+
+    def _reset(self, driver):
+        # Close extra tabs opened by the test (e.g. REG-067/REG-068)
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per-origin, so clear it while still on the application page
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass
+
+        # Cookies for every domain; delete_all_cookies() only covers the current one
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+
+    def lease(self, headless=False):
+        while True:
+            with self._lock:
+                entry = None
+                for i, (idle_headless, _) in enumerate(self._idle):
+                    if idle_headless == headless:
+                        entry = self._idle.pop(i)
+                        break
+            if entry is None:
+                break
+            if self._is_healthy(entry[1]):
+                with self._lock:
+                    self._leased[id(entry[1])] = entry
+                logger.info("WebDriver leased from pool")
+                return entry[1]
+            logger.warning("Pooled WebDriver failed health check, discarding")
+            self._quit(entry[1])
+
+        driver = self._create(headless)
+        with self._lock:
+            self._leased[id(driver)] = (headless, driver)
+        return driver
+
+    def release(self, driver):
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            return
+
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"WebDriver reset failed, discarding: {e}")
+            self._quit(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(entry)
+                logger.info("WebDriver returned to pool")
+                return
+        # Pool is full: this was an overflow lease
+        self._quit(driver)
+        logger.info("WebDriver closed")
+
+    def shutdown(self):
+        with self._lock:
+            entries = self._idle + list(self._leased.values())
+            self._idle = []
+            self._leased = {}
+        for _, driver in entries:
+            self._quit(driver)
+        if entries:
+            logger.info(f"Driver pool shut down ({len(entries)} WebDriver(s) closed)")
+
+driver_pool = DriverPool()
+atexit.register(driver_pool.shutdown)
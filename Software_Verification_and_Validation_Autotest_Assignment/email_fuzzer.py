@@ -0,0 +1,114 @@
+# email_fuzzer.py
+import random
+import string
+import itertools
+
+LOCAL_CHARS = string.ascii_lowercase + string.digits
+SPECIAL_CHARS = "!#$%&'*+/=?^_`{|}~-\"(),:;<>[\\]"
+WHITESPACE = [" ", "\t", "\u00a0", "\u200b"]
+TLDS = ["com", "org", "net", "io", "co.uk"]
+IDN_DOMAINS = ["münchen.de", "例え.jp", "пример.рф", "bücher.example", "ñandú.com", "xn--80asehdb.com"]
+IDN_LOCALS = ["josé", "用户", "пользователь", "δοκιμή", "müller"]
+
+def word(rng, low=3, high=10):
+    return "".join(rng.choice(LOCAL_CHARS) for _ in range(rng.randint(low, high)))
+
+def insert(rng, text, chars):
+    pos = rng.randint(0, len(text))
+    return text[:pos] + chars + text[pos:]
+
+def padded_domain(length):
+    # "bbb.bbb.com" of exactly `length` chars, no label longer than 63
+    labels, remaining = [], length - len(".com")
+    while remaining > 63:
+        size = 62 if remaining == 64 else 63
+        labels.append("b" * size)
+        remaining -= size + 1
+    labels.append("b" * remaining)
+    return ".".join(labels) + ".com"
+
+# Mutation classes: each takes (rng, local part, domain) of a random valid address and returns one variant.
+# Acceptance rates are reported per class.
+def mutate_baseline(rng, local, domain):
+    return f"{local}@{domain}"
+
+def mutate_plus_tag(rng, local, domain):
+    return f"{local}+{word(rng, 1, 6)}@{domain}"
+
+def mutate_case(rng, local, domain):
+    return f"{local.upper()}@{domain.upper()}"
+
+def mutate_local_special_char(rng, local, domain):
+    return f"{insert(rng, local, rng.choice(SPECIAL_CHARS))}@{domain}"
+
+def mutate_local_dots(rng, local, domain):
+    return f"{rng.choice(['.' + local, local + '.', insert(rng, local, '..')])}@{domain}"
+
+def mutate_quoted_local(rng, local, domain):
+    return f'"{local} {word(rng, 1, 5)}"@{domain}'
+
+def mutate_missing_part(rng, local, domain):
+    return rng.choice([local, f"@{domain}", f"{local}@", f"{local}@{domain.split('.')[0]}", f"{local}{domain}"])
+
+def mutate_multiple_at(rng, local, domain):
+    return f"{local}@{word(rng)}@{domain}"
+
+def mutate_whitespace(rng, local, domain):
+    return insert(rng, f"{local}@{domain}", rng.choice(WHITESPACE))
+
+def mutate_domain_label(rng, local, domain):
+    return rng.choice([
+        f"{local}@-{domain}",
+        f"{local}@{domain.replace('.', '-.', 1)}",
+        f"{local}@{domain.replace('.', '_', 1)}",
+        f"{local}@.{domain}",
+        f"{local}@{domain.replace('.', '..', 1)}",
+        f"{local}@{word(rng)}.{rng.choice(['c', '1', '123'])}",
+    ])
+
+def mutate_ip_literal(rng, local, domain):
+    return f"{local}@[{'.'.join(str(rng.randint(0, 255)) for _ in range(4))}]"
+
+def mutate_idn(rng, local, domain):
+    return rng.choice([f"{local}@{rng.choice(IDN_DOMAINS)}", f"{rng.choice(IDN_LOCALS)}@{domain}"])
+
+def mutate_length_local(rng, local, domain):
+    # RFC 5321: local part at most 64 octets
+    return f"{'a' * rng.choice([63, 64, 65, 100])}@{domain}"
+
+def mutate_length_label(rng, local, domain):
+    # DNS: each label at most 63 octets
+    return f"{local}@{'b' * rng.choice([63, 64])}.com"
+
+def mutate_length_total(rng, local, domain):
+    # RFC 5321 path limit: whole address at most 254 characters
+    total = rng.choice([253, 254, 255, 256, 320])
+    return f"{'a' * 64}@{padded_domain(total - 65)}"
+
+MUTATIONS = {
+    "baseline": mutate_baseline,
+    "plus-tag": mutate_plus_tag,
+    "case": mutate_case,
+    "local-special-char": mutate_local_special_char,
+    "local-dots": mutate_local_dots,
+    "quoted-local": mutate_quoted_local,
+    "missing-part": mutate_missing_part,
+    "multiple-at": mutate_multiple_at,
+    "whitespace": mutate_whitespace,
+    "domain-label": mutate_domain_label,
+    "ip-literal": mutate_ip_literal,
+    "idn": mutate_idn,
+    "length-local": mutate_length_local,
+    "length-label": mutate_length_label,
+    "length-total": mutate_length_total,
+}
+
+def generate(count=None, seed=0, classes=None):
+    # Lazily yields (n, mutation class, address); count=None streams forever.
+    # The same seed always reproduces the same campaign.
+    rng = random.Random(seed)
+    names = list(classes or MUTATIONS)
+    for n in (itertools.count() if count is None else range(count)):
+        name = names[n % len(names)]
+        domain = f"{word(rng)}.{rng.choice(TLDS)}"
+        yield n, name, MUTATIONS[name](rng, word(rng), domain)
@@ -0,0 +1,103 @@
+# email_oracle.py
+import re
+import sys
+from functools import lru_cache
+
+# Reference validity rules (RFC 5321/5322 addr-spec, RFC 1035 hostnames, IDNA domains), used to judge the
+# server's verdicts instead of relying on which hand-written list an address came from.
+# Deliberately practical where the RFCs are permissive: no comments, no folding whitespace, and the
+# domain must be a dotted public hostname (no "user@localhost") or an IPv4 literal.
+MAX_ADDRESS = 254       # RFC 5321 forward-path limit minus the angle brackets
+MAX_LOCAL = 64
+MAX_DOMAIN = 253
+MAX_LABEL = 63
+
+ATEXT = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]"
+DOT_ATOM_LOCAL = re.compile(rf"{ATEXT}+(?:\.{ATEXT}+)*\Z")
+QUOTED_LOCAL = re.compile(r'"(?:[\x20\x21\x23-\x5b\x5d-\x7e]|\\[\x20-\x7e])*"\Z')
+UTEXT = rf"(?:{ATEXT}|[^\x00-\x7f\s\u200b-\u200d\u2060\ufeff])"      # atext plus visible non-ASCII (RFC 6531)
+UTF8_LOCAL = re.compile(rf"{UTEXT}+(?:\.{UTEXT}+)*\Z")
+LABEL = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\Z")
+TLD = re.compile(r"(?:[A-Za-z]{2,63}|xn--[A-Za-z0-9-]{1,59})\Z")
+INVISIBLE = re.compile(r"[\s\u200b-\u200d\u2060\ufeff]")     # IDNA mapping would silently drop some of these
+IPV4_LITERAL = re.compile(r"\[(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})\]\Z")
+
+def check_local(local):
+    if not local:
+        return "empty local part"
+    if len(local.encode("utf-8")) > MAX_LOCAL:
+        return f"local part longer than {MAX_LOCAL} octets"
+    if DOT_ATOM_LOCAL.match(local) or QUOTED_LOCAL.match(local):
+        return None
+    if not local.isascii() and UTF8_LOCAL.match(local):
+        return None     # RFC 6531 internationalized local part
+    if local.startswith(".") or local.endswith(".") or ".." in local:
+        return "misplaced dot in local part"
+    return "illegal character in local part"
+
+@lru_cache(maxsize=65536)
+def check_domain(domain):
+    # Memoized: fuzz campaigns and real traffic reuse a small set of domains
+    if not domain:
+        return "empty domain"
+    if INVISIBLE.search(domain):
+        return "whitespace or invisible character in domain"
+    literal = IPV4_LITERAL.match(domain)
+    if literal:
+        return None if all(int(part) <= 255 for part in literal.groups()) else "IPv4 literal out of range"
+    if not domain.isascii():
+        try:
+            domain = domain.encode("idna").decode("ascii")
+        except UnicodeError:
+            return "domain is not a valid IDN"
+    if len(domain) > MAX_DOMAIN:
+        return f"domain longer than {MAX_DOMAIN} characters"
+
+    labels = domain.split(".")
+    if len(labels) < 2:
+        return "domain has no dot"
+    for label in labels:
+        if not label:
+            return "empty domain label"
+        if len(label) > MAX_LABEL:
+            return f"domain label longer than {MAX_LABEL} characters"
+        if not LABEL.match(label):
+            return "illegal character or hyphen placement in domain label"
+    if not TLD.match(labels[-1]):
+        return "top-level domain is not alphabetic (2+ letters)"
+    return None
+
+def check(email):
+    # Returns None for a valid address, otherwise the first rule it breaks
+    if len(email) > MAX_ADDRESS:
+        return f"address longer than {MAX_ADDRESS} characters"
+    local, at, domain = email.rpartition("@")
+    if not at:
+        return "missing @"
+    reason = check_domain(domain)
+    if reason:
+        return reason
+    if "@" in local and not QUOTED_LOCAL.match(local):
+        return "more than one @"
+    return check_local(local)
+
+def is_valid(email):
+    return check(email) is None
+
+def disagreement(email, accepted):
+    # Compares the server's verdict with the oracle: None when they agree,
+    # "accepted_invalid" (security relevant) or "rejected_valid" (usability) otherwise
+    reason = check(email)
+    if accepted and reason is not None:
+        return "accepted_invalid"
+    if not accepted and reason is None:
+        return "rejected_valid"
+    return None
+
+if __name__ == "__main__":
+    # Label addresses from files or stdin, one per line: VALID/INVALID, reason, address
+    lines = (line.rstrip("\r\n") for path in (sys.argv[1:] or ["-"])
+             for line in (sys.stdin if path == "-" else open(path, encoding="utf-8")))
+    for email in lines:
+        reason = check(email)
+        print(f"{'VALID' if reason is None else 'INVALID'}\t{reason or ''}\t{email}")
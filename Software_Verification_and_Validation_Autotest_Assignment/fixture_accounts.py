@@ -0,0 +1,97 @@
+# fixture_accounts.py
+import os
+import time
+import logging
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from http_client import HttpClient
+from pages import RS_URL
+
+logger = logging.getLogger(__name__)
+
+# Accounts registered up front over HTTP (one batch per process, so parallel workers never share one) and
+# leased to one test at a time. Tests report what they did to an account: a locked account is retired, a
+# changed password is remembered, so nothing is handed out in a state another test would trip over.
+ACCOUNT_POOL_SIZE = int(os.environ.get("AUTOTEST_ACCOUNT_POOL_SIZE", "8"))      # accounts provisioned per batch
+PROVISION_WORKERS = 8
+ACCOUNT_PASSWORD = "Abc12345"
+
+AVAILABLE, LEASED, LOCKED = "available", "leased", "locked"
+
+class AccountPool:
+    def __init__(self, size=ACCOUNT_POOL_SIZE):
+        self.size = size
+        self._accounts = []
+        self._seq = itertools.count()
+        self._stamp = int(time.time())
+        self._lock = threading.Lock()
+        self._provision_lock = threading.Lock()
+
+    def provision(self, count):
+        # Registers `count` fresh accounts concurrently; returns how many the app accepted
+        def register(n):
+            account = {"email": f"fixture{self._stamp}_{os.getpid()}_{n}@test.com",
+                       "username": f"fx{self._stamp % 100000}_{os.getpid() % 10000}_{n}"[:20],
+                       "password": ACCOUNT_PASSWORD, "state": AVAILABLE, "holder": None, "history": []}
+            try:
+                # The redirect target alone tells whether it worked
+                response = HttpClient().register(account["username"], account["email"], account["password"],
+                                                 follow_redirects=False)
+            except Exception as e:
+                logger.warning(f"Fixture account {account['email']} could not be registered: {e}")
+                return None
+            return account if RS_URL in response.url else None
+
+        with ThreadPoolExecutor(max_workers=PROVISION_WORKERS) as executor:
+            created = [account for account in executor.map(register, [next(self._seq) for _ in range(count)])
+                       if account]
+        with self._lock:
+            self._accounts.extend(created)
+        logger.info(f"Provisioned {len(created)}/{count} fixture accounts")
+        return len(created)
+
+    def _take(self, holder):
+        with self._lock:
+            for account in self._accounts:
+                if account["state"] == AVAILABLE:
+                    account["state"], account["holder"] = LEASED, holder
+                    account["history"].append(f"leased by {holder}")
+                    return account
+        return None
+
+    def lease(self, holder):
+        account = self._take(holder)
+        if account is None:
+            with self._provision_lock:
+                account = self._take(holder)
+                if account is None and self.provision(self.size):
+                    account = self._take(holder)
+        if account is None:
+            raise RuntimeError("No fixture account available and none could be provisioned")
+        return account
+
+    def mark_locked(self, account):
+        # Retired for the rest of the run: a lockout outlives the test that caused it
+        with self._lock:
+            account["state"] = LOCKED
+            account["history"].append(f"locked by {account['holder']}")
+
+    def change_password(self, account, password):
+        with self._lock:
+            account["password"] = password
+            account["history"].append(f"password changed by {account['holder']}")
+
+    def release(self, account):
+        with self._lock:
+            if account["state"] == LEASED:
+                account["state"], account["holder"] = AVAILABLE, None
+
+    def summary(self):
+        with self._lock:
+            states = {}
+            for account in self._accounts:
+                states[account["state"]] = states.get(account["state"], 0) + 1
+            return states
+
+account_pool = AccountPool()
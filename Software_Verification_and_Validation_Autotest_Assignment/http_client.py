@@ -0,0 +1,135 @@
+# http_client.py
+import os
+from html.parser import HTMLParser
+from http.cookies import SimpleCookie
+from urllib.parse import urljoin, urlencode, urlsplit
+import urllib3
+from pages import BASE_URL
+from timeline import timeline
+
+# One keep-alive connection pool shared by every client; clients only hold their own cookies
+HTTP_POOL_SIZE = int(os.environ.get("AUTOTEST_HTTP_POOL_SIZE", "32"))
+http_pool = urllib3.PoolManager(maxsize=HTTP_POOL_SIZE, block=True, retries=False,
+                                timeout=urllib3.Timeout(connect=5, read=30))
+MAX_REDIRECTS = 5
+
+class FormParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.forms = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form":
+            self.forms.append({"action": attrs.get("action") or "", "method": (attrs.get("method") or "get").lower(),
+                               "fields": []})
+        elif self.forms and tag in ("input", "button", "select", "textarea"):
+            self.forms[-1]["fields"].append({
+                "tag": tag, "name": attrs.get("name"), "id": attrs.get("id"),
+                "type": (attrs.get("type") or "text").lower(), "value": attrs.get("value", "")
+            })
+
+def find_form(html, field_name):
+    parser = FormParser()
+    parser.feed(html)
+    for form in parser.forms:
+        if any(field["name"] == field_name for field in form["fields"]):
+            return form
+    return None
+
+def form_fields(form, values, check_ids=()):
+    # What a browser would post: hidden fields and ticked checkboxes plus the typed values
+    fields = {}
+    for field in form["fields"]:
+        if not field["name"]:
+            continue
+        if field["type"] == "hidden":
+            fields[field["name"]] = field["value"]
+        elif field["type"] == "checkbox" and field["id"] in check_ids:
+            fields[field["name"]] = field["value"] or "on"
+    fields.update(values)
+    return fields
+
+class HttpResponse:
+    def __init__(self, status, url, text):
+        self.status = status
+        self.url = url
+        self.text = text
+
+    def result(self):
+        # Same shape as BasePage.result(): (current_url, lower-cased page source)
+        return self.url, self.text.lower()
+
+class HttpClient:
+    def __init__(self, base_url=BASE_URL):
+        self.base_url = base_url
+        self.cookies = {}
+
+    def _store_cookies(self, response):
+        for header in response.headers.getlist("Set-Cookie"):
+            cookie = SimpleCookie()
+            cookie.load(header)
+            for name, morsel in cookie.items():
+                self.cookies[name] = morsel.value
+
+    def request(self, method, url, fields=None, follow_redirects=True):
+        body = None
+        if fields is not None and method == "GET":
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(fields)}"
+        elif fields is not None:
+            body = urlencode(fields)
+        for _ in range(MAX_REDIRECTS + 1):
+            headers = {"Connection": "keep-alive"}
+            if self.cookies:
+                headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+            if body is not None:
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+            with timeline.span(f"{method} {urlsplit(url).path}", "http"):
+                response = http_pool.request(method, url, body=body, headers=headers, redirect=False)
+            self._store_cookies(response)
+
+            location = response.headers.get("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                if not follow_redirects:
+                    # The Location alone tells the outcome; report it as the final URL and skip the extra round trip
+                    return HttpResponse(response.status, url, response.data.decode("utf-8", errors="replace"))
+                if response.status in (301, 302, 303):
+                    method, body = "GET", None
+                continue
+            return HttpResponse(response.status, url, response.data.decode("utf-8", errors="replace"))
+        raise urllib3.exceptions.MaxRetryError(http_pool, url, "too many redirects")
+
+    def get(self, url):
+        return self.request("GET", url)
+
+    def load_form(self, page_url, field_name):
+        # Load the page for its session cookie and hidden fields (CSRF tokens etc.)
+        page = self.get(page_url)
+        form = find_form(page.text, field_name)
+        if form is None:
+            raise ValueError(f"No form with field '{field_name}' on {page_url}")
+        form["url"] = urljoin(page.url, form["action"] or page.url)
+        return form
+
+    def post_form(self, form, values, check_ids=(), follow_redirects=True):
+        fields = form_fields(form, values, check_ids)
+        return self.request("POST" if form["method"] == "post" else "GET", form["url"], fields, follow_redirects)
+
+    def submit_form(self, page_url, values, check_ids=()):
+        return self.post_form(self.load_form(page_url, next(iter(values))), values, check_ids)
+
+    def register(self, username, email, password, confirm_password=None, agree_terms=True,
+                 form=None, follow_redirects=True):
+        # Bulk runs pass a form from load_form() so register.jsp is fetched once, not per submission
+        if confirm_password is None:
+            confirm_password = password
+        values = {"email": email, "username": username, "password": password, "confirmPassword": confirm_password}
+        check_ids = ("form2Example3c",) if agree_terms else ()
+        if form is None:
+            form = self.load_form(f"{self.base_url}/register.jsp", "email")
+        return self.post_form(form, values, check_ids, follow_redirects)
+
+    def login(self, email, password):
+        return self.submit_form(f"{self.base_url}/login.jsp", {"email": email, "password": password})
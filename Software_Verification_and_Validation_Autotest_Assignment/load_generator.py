@@ -0,0 +1,378 @@
+# load_generator.py
+import os
+import json
+import math
+import random
+import asyncio
+import logging
+import argparse
+from datetime import datetime
+from collections import Counter
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit, urljoin, urlencode
+from pages import BASE_URL
+from http_client import find_form, form_fields
+from timeline import percentile
+
+logger = logging.getLogger(__name__)
+
+# Open-model load: virtual users arrive at a target rate (Poisson arrivals shaped by the profile) and replay
+# the REG (register.jsp submit) or LGN (login.jsp -> welcome.jsp) flow on their own keep-alive connection.
+# Everything runs on one asyncio loop with a plain HTTP/1.1 client, so thousands of users need no threads.
+LOAD_USERS = int(os.environ.get("AUTOTEST_LOAD_USERS", "1000"))
+LOAD_RATE = float(os.environ.get("AUTOTEST_LOAD_RATE", "50"))          # arrivals per second at full load
+LOAD_PROFILE = os.environ.get("AUTOTEST_LOAD_PROFILE", "ramp")          # constant | ramp | step
+LOAD_RAMP = float(os.environ.get("AUTOTEST_LOAD_RAMP", "30"))          # ramp duration / seconds per step
+LOAD_STEPS = 5
+LOAD_THINK = float(os.environ.get("AUTOTEST_LOAD_THINK", "1.0"))       # mean think time between pages (exponential)
+LOAD_MIX = os.environ.get("AUTOTEST_LOAD_MIX", "reg=0.3,lgn=0.7")
+LOAD_ACCOUNTS = 50              # accounts registered up front for the LGN flow
+LOAD_TIMEOUT = 30.0
+MAX_CONNECTIONS = int(os.environ.get("AUTOTEST_LOAD_MAX_CONNECTIONS", "2000"))   # open sockets (one per active user)
+REPORT_EVERY = 5.0
+SATURATION_FACTOR = 3.0         # interval p95 this many times the first interval's p95 = saturated
+HISTOGRAM_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+PASSWORD = "Load1234abcd"
+
+def profile_rate(profile, rate, ramp, elapsed):
+    if profile == "ramp" and ramp > 0:
+        return rate * min(1.0, elapsed / ramp)
+    if profile == "step" and ramp > 0:
+        return rate * min(LOAD_STEPS, int(elapsed // ramp) + 1) / LOAD_STEPS
+    return rate
+
+def parse_mix(mix):
+    # "reg=0.3,lgn=0.7" -> {"REG": 0.3, "LGN": 0.7}
+    weights = {}
+    for part in mix.split(","):
+        flow, _, weight = part.partition("=")
+        weights[flow.strip().upper()] = float(weight or 1)
+    unknown = set(weights) - set(FLOWS)
+    if unknown:
+        raise ValueError(f"Unknown flow(s) in mix: {', '.join(sorted(unknown))}")
+    return weights
+
+class LoadStats:
+    # Single event loop, so no locking
+    def __init__(self):
+        self.latencies = {}         # endpoint -> [seconds]
+        self.errors = Counter()     # endpoint -> failed requests
+        self.flows = Counter()      # "REG ok", "LGN failed", ...
+        self.interval = []          # (endpoint, seconds, ok) since the last progress line
+        self.series = []
+        self.active = 0
+
+    def record(self, endpoint, seconds, ok):
+        self.latencies.setdefault(endpoint, []).append(seconds)
+        if not ok:
+            self.errors[endpoint] += 1
+        self.interval.append((endpoint, seconds, ok))
+
+    def tick(self, elapsed, target_rate):
+        samples, self.interval = self.interval, []
+        latencies = sorted(seconds * 1000 for _, seconds, _ in samples)
+        point = {"elapsed_s": round(elapsed, 1), "target_arrivals_per_s": round(target_rate, 2), "active_users": self.active,
+                 "requests_per_s": round(len(samples) / REPORT_EVERY, 1),
+                 "errors": sum(1 for _, _, ok in samples if not ok),
+                 "p95_ms": round(percentile(latencies, 0.95), 1) if latencies else None}
+        self.series.append(point)
+        logger.info(f"[{point['elapsed_s']:>6.1f}s] target {point['target_arrivals_per_s']:>7.1f} users/s | "
+                    f"{point['active_users']:>5} active | {point['requests_per_s']:>8.1f} req/s | "
+                    f"p95 {point['p95_ms'] if latencies else '-':>8} ms | {point['errors']} errors")
+
+    def saturation(self):
+        # First interval whose p95 blew up against the first loaded interval, or that started failing
+        loaded = [point for point in self.series if point["p95_ms"] is not None]
+        if not loaded:
+            return None
+        baseline = max(loaded[0]["p95_ms"], 1.0)
+        for point in loaded[1:]:
+            if point["p95_ms"] > baseline * SATURATION_FACTOR or point["errors"]:
+                return point
+        return None
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for endpoint, samples in sorted(self.latencies.items()):
+            latencies = sorted(seconds * 1000 for seconds in samples)
+            histogram, start = {}, 0
+            for bound in HISTOGRAM_MS:
+                end = next((i for i in range(start, len(latencies)) if latencies[i] > bound), len(latencies))
+                histogram[f"<={bound}ms"] = end - start
+                start = end
+            histogram[f">{HISTOGRAM_MS[-1]}ms"] = len(latencies) - start
+            endpoints[endpoint] = {
+                "requests": len(latencies), "errors": self.errors[endpoint],
+                "throughput_per_s": round(len(latencies) / elapsed, 2) if elapsed else 0,
+                "p50_ms": round(percentile(latencies, 0.5), 2), "p95_ms": round(percentile(latencies, 0.95), 2),
+                "p99_ms": round(percentile(latencies, 0.99), 2), "max_ms": round(latencies[-1], 2),
+                "histogram": histogram,
+            }
+        return endpoints
+
+class VirtualUser:
+    # One keep-alive connection and cookie jar per user, like a browser tab
+    def __init__(self, base_url, stats, rng, think):
+        url = urlsplit(base_url)
+        self.base_url = base_url
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = url.scheme == "https"
+        self.stats = stats
+        self.rng = rng
+        self.think_time = think
+        self.cookies = {}
+        self.reader = self.writer = None
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+        self.reader = self.writer = None
+
+    async def think(self):
+        if self.think_time > 0:
+            await asyncio.sleep(self.rng.expovariate(1 / self.think_time))
+
+    async def exchange(self, method, url, body, retry_stale=True):
+        reused = self.writer is not None
+        if not reused:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+        target = urlsplit(url)
+        path = f"{target.path or '/'}{'?' + target.query if target.query else ''}"
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {target.netloc}", "Connection: keep-alive"]
+        if self.cookies:
+            lines.append("Cookie: " + "; ".join(f"{k}={v}" for k, v in self.cookies.items()))
+        payload = b""
+        if body is not None:
+            payload = body.encode("utf-8")
+            lines += ["Content-Type: application/x-www-form-urlencoded", f"Content-Length: {len(payload)}"]
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            await self.close()
+            if reused and retry_stale:
+                # The server dropped the idle keep-alive connection during think time; browsers resend too
+                return await self.exchange(method, url, body, retry_stale=False)
+            raise ConnectionError("server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        set_cookies = []
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            if name.lower() == "set-cookie":
+                set_cookies.append(value.strip())
+            headers[name.lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await self.reader.readline()).strip():
+                        pass        # trailers
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            data = await self.reader.read()
+            headers["connection"] = "close"
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        for header in set_cookies:
+            cookie = SimpleCookie()
+            cookie.load(header)
+            for name, morsel in cookie.items():
+                self.cookies[name] = morsel.value
+        return status, headers, data.decode("utf-8", errors="replace")
+
+    async def request(self, method, url, fields=None):
+        # Follows redirects like a browser; every hop is timed under its own endpoint ("POST /login.jsp")
+        body = urlencode(fields) if fields is not None else None
+        for _ in range(5):
+            endpoint = f"{method} {urlsplit(url).path}"
+            start = asyncio.get_running_loop().time()
+            try:
+                status, headers, text = await asyncio.wait_for(self.exchange(method, url, body), LOAD_TIMEOUT)
+            except (OSError, ValueError, IndexError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                self.stats.record(endpoint, asyncio.get_running_loop().time() - start, False)
+                await self.close()
+                raise ConnectionError(f"{endpoint}: {type(e).__name__} {e}") from e
+            self.stats.record(endpoint, asyncio.get_running_loop().time() - start, status < 500)
+            if status in (301, 302, 303, 307, 308) and "location" in headers:
+                url = urljoin(url, headers["location"])
+                method, body = "GET", None
+                continue
+            return status, url, text
+        raise ConnectionError(f"too many redirects from {url}")
+
+    async def register(self, username, email):
+        status, url, text = await self.request("GET", f"{self.base_url}/register.jsp")
+        form = find_form(text, "email")
+        if form is None:
+            raise ConnectionError("no registration form")
+        await self.think()
+        values = {"username": username, "email": email, "password": PASSWORD, "confirmPassword": PASSWORD}
+        status, url, text = await self.request("POST", urljoin(url, form["action"] or url),
+                                               form_fields(form, values, ("form2Example3c",)))
+        return "register=success" in url or "sign in" in text.lower()
+
+    async def login(self, email):
+        status, url, text = await self.request("GET", f"{self.base_url}/login.jsp")
+        form = find_form(text, "email")
+        if form is None:
+            raise ConnectionError("no login form")
+        await self.think()
+        status, url, text = await self.request("POST", urljoin(url, form["action"] or url),
+                                               form_fields(form, {"email": email, "password": PASSWORD}))
+        return "welcome.jsp" in url
+
+async def reg_flow(user, n, stamp, accounts):
+    return await user.register(f"vu{n}_{stamp % 100000}", f"vu{stamp}_{n}@load.test")
+
+async def lgn_flow(user, n, stamp, accounts):
+    return await user.login(user.rng.choice(accounts))
+
+FLOWS = {"REG": reg_flow, "LGN": lgn_flow}
+
+async def run_load(base_url=BASE_URL, users=LOAD_USERS, rate=LOAD_RATE, profile=LOAD_PROFILE, ramp=LOAD_RAMP,
+                   think=LOAD_THINK, mix=LOAD_MIX, seed=0):
+    stats = LoadStats()
+    rng = random.Random(seed)
+    weights = parse_mix(mix)
+    stamp = int(datetime.now().timestamp())
+    loop = asyncio.get_running_loop()
+    connections = asyncio.Semaphore(MAX_CONNECTIONS)
+
+    # LGN users log in to accounts registered up front; setup traffic is not part of the statistics
+    setup = LoadStats()
+    accounts = [f"vu{stamp}_acct{i}@load.test" for i in range(LOAD_ACCOUNTS)]
+    if "LGN" in weights:
+        logger.info(f"Registering {len(accounts)} accounts for the login flow")
+        for i, email in enumerate(accounts):
+            user = VirtualUser(base_url, setup, rng, 0)
+            try:
+                await user.register(f"vuacct{i}_{stamp % 10000}", email)
+            finally:
+                await user.close()
+
+    async def virtual_user(n, flow):
+        async with connections:
+            stats.active += 1
+            user = VirtualUser(base_url, stats, random.Random(seed * 1000003 + n), think)
+            start = loop.time()
+            try:
+                ok = await FLOWS[flow](user, n, stamp, accounts)
+            except ConnectionError as e:
+                logger.debug(f"Virtual user {n} ({flow}) failed: {e}")
+                ok = False
+            finally:
+                stats.active -= 1
+                await user.close()
+            stats.flows[f"{flow} {'ok' if ok else 'failed'}"] += 1
+            stats.latencies.setdefault(f"flow {flow}", []).append(loop.time() - start)
+
+    async def reporter():
+        while True:
+            await asyncio.sleep(REPORT_EVERY)
+            elapsed = loop.time() - started
+            stats.tick(elapsed, profile_rate(profile, rate, ramp, elapsed))
+
+    logger.info(f"Load: {users} virtual users, {profile} to {rate}/s (ramp {ramp}s), think {think}s, mix {mix}")
+    started = loop.time()
+    progress = asyncio.create_task(reporter())
+    tasks = []
+    flows, flow_weights = list(weights), list(weights.values())
+    while len(tasks) < users:
+        # Poisson arrivals at the profile's current rate, by thinning: candidates arrive at the full rate and
+        # each is kept with probability current/full, so a near-zero rate early in a ramp never stalls the loop
+        await asyncio.sleep(rng.expovariate(rate))
+        if rng.random() * rate > profile_rate(profile, rate, ramp, loop.time() - started):
+            continue
+        tasks.append(asyncio.create_task(virtual_user(len(tasks), rng.choices(flows, flow_weights)[0])))
+    await asyncio.gather(*tasks)
+    progress.cancel()
+    elapsed = loop.time() - started
+    stats.tick(elapsed, profile_rate(profile, rate, ramp, elapsed))
+
+    return {
+        "timestamp": datetime.now().isoformat(), "base_url": base_url, "users": users, "rate": rate,
+        "profile": profile, "ramp_s": ramp, "think_s": think, "mix": weights, "seed": seed,
+        "elapsed_s": round(elapsed, 2), "flows": dict(stats.flows),
+        "endpoints": stats.summary(elapsed), "series": stats.series, "saturation": stats.saturation(),
+    }
+
+def log_results(results):
+    logger.info("\n" + "="*70)
+    logger.info("           LOAD TEST REPORT")
+    logger.info("="*70)
+    logger.info(f"{results['users']} users in {results['elapsed_s']}s, flows: "
+                + ", ".join(f"{name} {count}" for name, count in sorted(results["flows"].items())))
+    logger.info(f"  {'endpoint':<24} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>9}")
+    for endpoint, stats in results["endpoints"].items():
+        logger.info(f"  {endpoint:<24} {stats['requests']:>9} {stats['errors']:>7} {stats['throughput_per_s']:>8.1f} "
+                    f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>9.1f}")
+    for endpoint, stats in results["endpoints"].items():
+        if endpoint.startswith("flow "):
+            continue
+        peak = max(stats["histogram"].values()) or 1
+        logger.info(f"\n  {endpoint} latency histogram:")
+        for bucket, count in stats["histogram"].items():
+            if count:
+                logger.info(f"    {bucket:>10} {count:>8} {'#' * math.ceil(40 * count / peak)}")
+    saturation = results["saturation"]
+    if saturation:
+        logger.warning(f"\nSaturation at {saturation['elapsed_s']}s: target {saturation['target_arrivals_per_s']} users/s, "
+                       f"{saturation['active_users']} active, p95 {saturation['p95_ms']} ms, {saturation['errors']} errors")
+    else:
+        logger.info("\nNo saturation detected at the tested load")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Replay registration/login flows as virtual users")
+    parser.add_argument("--users", type=int, default=LOAD_USERS, help="virtual users to start in total")
+    parser.add_argument("--rate", type=float, default=LOAD_RATE, help="arrivals per second at full load")
+    parser.add_argument("--profile", choices=["constant", "ramp", "step"], default=LOAD_PROFILE,
+                        help="constant rate, linear ramp up to --rate, or LOAD_STEPS equal steps")
+    parser.add_argument("--ramp", type=float, default=LOAD_RAMP, help="ramp duration (ramp) or seconds per step (step)")
+    parser.add_argument("--think", type=float, default=LOAD_THINK, help="mean think time between pages, seconds")
+    parser.add_argument("--mix", default=LOAD_MIX, help="flow weights, e.g. reg=0.3,lgn=0.7")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--standin", action="store_true", help="load a fresh in-process stand-in app instead")
+    args = parser.parse_args()
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.rate <= 0 or args.users <= 0:
+        parser.error("--users and --rate must be positive")
+
+    base_url, standin = BASE_URL, None
+    if args.standin:
+        from standin_server import StandInServer
+        standin = StandInServer(latency=0, fault_rate=0).start()
+        base_url = standin.base_url
+    try:
+        results = asyncio.run(run_load(base_url, args.users, args.rate, args.profile, args.ramp, args.think,
+                                       args.mix, args.seed))
+    finally:
+        if standin:
+            standin.stop()
+
+    log_results(results)
+    report_file = f"LOAD_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    logger.info(f"\nLoad report saved: {report_file}")
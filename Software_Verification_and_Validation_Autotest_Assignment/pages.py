@@ -0,0 +1,123 @@
+# pages.py
+import os
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
+from result_detector import mark_submit
+from timeline import timeline
+
+BASE_URL = os.environ.get("AUTOTEST_BASE_URL", "http://localhost:8080")
+REGISTER_URL = f"{BASE_URL}/register.jsp"
+LOGIN_URL = f"{BASE_URL}/login.jsp"
+WELCOME_URL = f"{BASE_URL}/welcome.jsp"
+RS_URL = "register=success"
+
+FAST_FILL_SCRIPT = """
+const values = arguments[0];
+for (const name in values) {
+    const field = document.getElementsByName(name)[0];
+    if (!field) continue;
+    field.focus();
+    field.value = values[name];
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+    field.dispatchEvent(new Event('change', {bubbles: true}));
+    field.blur();
+}
+const terms = document.getElementById('form2Example3c');
+if (arguments[1] && terms && !terms.checked) {
+    terms.click();
+}
+"""
+
+class BasePage:
+    url = None
+    locators = {}
+    ready = "email"
+
+    def __init__(self, test):
+        # The owning TestBase supplies driver/wait, which change on every setup()
+        self.test = test
+        self._elements = {}
+
+    @property
+    def driver(self):
+        return self.test.driver
+
+    def open(self):
+        with timeline.span(f"{type(self).__name__}.open", "page"):
+            self.driver.get(self.url)
+            self.invalidate()
+            self.test.wait.until(EC.presence_of_element_located(self.locators[self.ready]))
+        return self
+
+    def invalidate(self):
+        self._elements.clear()
+
+    def element(self, key):
+        # Handles stay valid until the page navigates (open/submit), so look each one up only once
+        element = self._elements.get(key)
+        if element is None:
+            element = self._elements[key] = self.driver.find_element(*self.locators[key])
+        return element
+
+    def act(self, key, action):
+        try:
+            return action(self.element(key))
+        except StaleElementReferenceException:
+            # The page re-rendered without going through open()/submit(); look the handles up again
+            self.invalidate()
+            return action(self.element(key))
+
+    def submit(self):
+        # Stamp the current document so the result detector can tell when it has been replaced
+        with timeline.span(f"{type(self).__name__}.submit", "page"):
+            mark_submit(self.driver)
+            self.test.submit_stamped = True
+            self.act("submit", lambda e: e.click())
+            self.invalidate()
+
+    def result(self):
+        return self.driver.current_url, self.driver.page_source.lower()
+
+class RegisterPage(BasePage):
+    url = REGISTER_URL
+    locators = {
+        "username": (By.NAME, "username"),
+        "email": (By.NAME, "email"),
+        "password": (By.NAME, "password"),
+        "confirmPassword": (By.NAME, "confirmPassword"),
+        "terms": (By.ID, "form2Example3c"),
+        "submit": (By.CSS_SELECTOR, "button[type='submit']"),
+    }
+
+    def fill(self, username, email, password, confirm_password=None, agree_terms=True, mode=None):
+        if confirm_password is None:
+            confirm_password = password
+        values = {"username": username, "email": email, "password": password, "confirmPassword": confirm_password}
+
+        mode = self.test.fill_mode_override or mode or self.test.fill_mode
+        with timeline.span("RegisterPage.fill", "page", mode=mode):
+            if mode == "fast":
+                # One round trip; fires input/change so the page's own validation still runs
+                self.driver.execute_script(FAST_FILL_SCRIPT, values, agree_terms)
+                return
+
+            for name, value in values.items():
+                self.act(name, lambda e: e.send_keys(value))
+            if agree_terms:
+                self.act("terms", lambda e: e.is_selected() or e.click())
+
+class LoginPage(BasePage):
+    url = LOGIN_URL
+    locators = {
+        "email": (By.NAME, "email"),
+        "password": (By.NAME, "password"),
+        "submit": (By.CSS_SELECTOR, "button[type='submit']"),
+    }
+
+    def fill(self, email, password, clear=False):
+        with timeline.span("LoginPage.fill", "page"):
+            for name, value in (("email", email), ("password", password)):
+                if clear:
+                    self.act(name, lambda e: e.clear())
+                self.act(name, lambda e: e.send_keys(value))
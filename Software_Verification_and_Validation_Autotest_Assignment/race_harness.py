@@ -0,0 +1,142 @@
+# race_harness.py
+import os
+import math
+import time
+import threading
+import http.client
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit, urljoin, urlencode
+from pages import BASE_URL
+from http_client import HttpResponse, find_form, form_fields
+
+# N requests for the same resource released together. Every racer has its own connection, already connected
+# and holding its session cookie; the whole request except the body's last byte is sent up front, so the release
+# only has to push one byte per racer and the server sees the requests complete within microseconds.
+RACE_RACERS = int(os.environ.get("AUTOTEST_RACE_RACERS", "8"))
+RACE_REPEATS = int(os.environ.get("AUTOTEST_RACE_REPEATS", "20"))
+RACE_TIMEOUT = 30
+PARK_DELAY = 0.02       # lets the reader threads get from the barrier to the release event
+
+class Racer:
+    def __init__(self, base_url=BASE_URL):
+        url = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(url.hostname, url.port, timeout=RACE_TIMEOUT)
+        self.base_url = base_url
+        self.base_path = url.path.rstrip("/")
+        self.cookies = {}
+        self.sent_ns = None         # when the last byte went out
+        self.done_ns = None         # when the response had been read
+        self.response = None
+        self.error = None
+        self._last_byte = None
+        self._url = None
+
+    def _headers(self):
+        headers = {"Connection": "keep-alive"}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        return headers
+
+    def _read(self, url):
+        response = self.connection.getresponse()
+        text = response.read().decode("utf-8", errors="replace")
+        for header in response.headers.get_all("Set-Cookie") or []:
+            cookie = SimpleCookie()
+            cookie.load(header)
+            for name, morsel in cookie.items():
+                self.cookies[name] = morsel.value
+        location = response.getheader("Location")
+        # Redirects are not followed: the Location alone tells the outcome, as with follow_redirects=False
+        return HttpResponse(response.status, urljoin(url, location) if location else url, text)
+
+    def load_form(self, page_path, field_name):
+        # Also connects and picks up the session cookie, so none of that happens during the race
+        url = f"{self.base_url}{page_path}"
+        self.connection.request("GET", f"{self.base_path}{page_path}", headers=self._headers())
+        page = self._read(url)
+        form = find_form(page.text, field_name)
+        if form is None:
+            raise ValueError(f"No form with field '{field_name}' on {url}")
+        if form["method"] != "post":
+            raise ValueError(f"Form on {url} is not posted; nothing to race")
+        form["url"] = urljoin(url, form["action"] or url)
+        return form
+
+    def arm(self, form, values, check_ids=()):
+        body = urlencode(form_fields(form, values, check_ids)).encode("utf-8")
+        target = urlsplit(form["url"])
+        self.connection.putrequest("POST", f"{target.path}{'?' + target.query if target.query else ''}",
+                                   skip_accept_encoding=True)
+        headers = self._headers()
+        headers.update({"Content-Type": "application/x-www-form-urlencoded", "Content-Length": str(len(body))})
+        for name, value in headers.items():
+            self.connection.putheader(name, value)
+        self.connection.endheaders()
+        self.connection.send(body[:-1])
+        self._last_byte = body[-1:]
+        self._url = form["url"]
+
+    def release(self):
+        self.sent_ns = time.perf_counter_ns()
+        try:
+            self.connection.send(self._last_byte)
+        except OSError as e:
+            self.error = e
+
+    def collect(self):
+        try:
+            if self.error is None:
+                self.response = self._read(self._url)
+        except (OSError, http.client.HTTPException) as e:
+            self.error = e
+        self.done_ns = time.perf_counter_ns()
+
+    def close(self):
+        self.connection.close()
+
+def race(racers):
+    # The last bytes go out back to back from this one thread while every reader thread is parked (holding no
+    # GIL) until all of them are sent. Sending from N woken threads, or letting a reader parse an early response
+    # mid-release, costs a GIL hand-off each and spreads the requests over milliseconds.
+    barrier = threading.Barrier(len(racers) + 1)
+    released = threading.Event()
+
+    def run(racer):
+        barrier.wait()
+        released.wait()
+        racer.collect()
+
+    threads = [threading.Thread(target=run, args=(racer,)) for racer in racers]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    time.sleep(PARK_DELAY)
+    for racer in racers:
+        racer.release()
+    released.set()
+    for thread in threads:
+        thread.join()
+
+    sent = [racer.sent_ns for racer in racers]
+    done = [racer.done_ns for racer in racers]
+    return {
+        "send_skew_ms": (max(sent) - min(sent)) / 1e6,
+        "response_spread_ms": (max(done) - min(done)) / 1e6,
+    }
+
+def wilson_interval(hits, trials, z=1.96):
+    # 95% confidence interval of a proportion; stays meaningful at 0 hits, unlike hits/trials
+    if not trials:
+        return 0.0, 1.0
+    p = hits / trials
+    centre = (p + z * z / (2 * trials)) / (1 + z * z / trials)
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / (1 + z * z / trials)
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+def race_summary(stats):
+    skews = sorted(entry["send_skew_ms"] for entry in stats)
+    spreads = sorted(entry["response_spread_ms"] for entry in stats)
+    return {"races": len(stats), "send_skew_ms_p50": round(skews[len(skews) // 2], 3) if skews else None,
+            "send_skew_ms_max": round(skews[-1], 3) if skews else None,
+            "response_spread_ms_p50": round(spreads[len(spreads) // 2], 3) if spreads else None}
@@ -0,0 +1,183 @@
+# registry.py
+import re
+import fnmatch
+import itertools
+import importlib
+from case_tables import row_ids
+
+# Every runnable test, keyed by its report ID. Declaring a test here imports nothing: suite modules
+# (and Selenium with them) are only loaded when a job actually runs, so listing and planning stay instant.
+# A batched table runs as one job that takes all its rows at once (the HTTP twins submit them concurrently);
+# its results are still one per row, so a rerun can pick out the failed ones.
+def spec(test_id, title, module, class_name, methods, tags, table=None, resources=None, batch=False):
+    return {"id": test_id, "title": title, "module": module, "class": class_name, "methods": methods,
+            "tags": tags, "table": table, "resources": resources or {}, "batch": batch}
+
+# Shared state a test touches beyond its own fixture accounts, and how: any number of SHARED users may run
+# together, an EXCLUSIVE user runs alone. Tests declaring nothing conflict with nothing.
+SHARED, EXCLUSIVE = "shared", "exclusive"
+LOCKOUT_STATE = "lockout-state"         # failed-login counters; per client IP too if the app gets scoping wrong
+ADMIN_ACCOUNT = "account:admin@system.com"
+BYPASS_EMAIL = "email:bypass@evil.com"
+
+LOGS_IN = {LOCKOUT_STATE: SHARED}               # needs a valid login to go through
+LOCKS_OUT = {LOCKOUT_STATE: EXCLUSIVE}          # piles up failed logins
+
+TESTS = [
+    spec("REG-020", "Invalid Email Formats", "Registration.Email_Validation", "EmailValidationTests",
+         ["invalid_email_formats"], ["registration", "email", "validation", "browser", "ui-only"], table="REG-020"),
+    spec("REG-021", "Excessive Email Length Boundary Test", "Registration.Email_Validation", "EmailValidationTests",
+         ["excessive_email_length_boundary"], ["registration", "email", "boundary", "browser", "ui-only"], table="REG-021"),
+    spec("REG-022", "Valid Email Format Variants", "Registration.Email_Validation", "EmailValidationTests",
+         ["valid_email_variants"], ["registration", "email", "validation", "browser"], table="REG-022"),
+    spec("REG-060", "Email with Leading/Trailing Spaces", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["email_with_spaces"], ["registration", "email", "normalization", "browser"]),
+    spec("REG-061", "Email Case Insensitive Duplicate Handling", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["email_case_handling"], ["registration", "email", "normalization", "browser"]),
+    spec("REG-062", "Bypass Frontend Validation with JS Injection", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["bypass_frontend_validation"], ["registration", "security", "browser", "ui-only"],
+         resources={BYPASS_EMAIL: EXCLUSIVE}),
+    spec("REG-063", "Password Leading/Trailing Spaces Handling", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["password_with_spaces"], ["registration", "password", "normalization", "browser"],
+         resources=LOGS_IN),
+    spec("REG-064", "Form State Retention After Validation Error", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["form_state_after_error"], ["registration", "ui", "browser"]),
+    spec("REG-066", "Double-Click Register Button Protection", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["double_click_register_button"], ["registration", "concurrency", "browser"]),
+    spec("REG-067", "Concurrent registration with same email in two tabs", "Registration.Input_Normalization_Robustness",
+         "AdvancedInputCaseTests", ["concurrent_same_email"], ["registration", "concurrency", "browser"]),
+    spec("REG-068", "Concurrent registration of different accounts in parallel tabs",
+         "Registration.Input_Normalization_Robustness", "AdvancedInputCaseTests", ["concurrent_different_accounts"],
+         ["registration", "concurrency", "browser"]),
+    spec("REG-030", "Password Length Boundaries (MIN=3, MAX=25)", "Registration.Password_Length_Boundary",
+         "PasswordLengthBoundaryTest", ["password_length_boundaries"], ["registration", "password", "boundary", "browser"],
+         table="REG-030"),
+    spec("REG-014", "Password Field Illegal & Special Characters Handling", "Registration.RF_BV",
+         "BoundaryAndSpecialInputTests", ["password_illegal_special_characters"],
+         ["registration", "password", "security", "browser", "ui-only"], table="REG-014"),
+    spec("REG-016", "Excessive Username Length Boundary Test", "Registration.RF_BV", "BoundaryAndSpecialInputTests",
+         ["excessive_username_length_boundary"], ["registration", "username", "boundary", "browser", "ui-only"],
+         table="REG-016"),
+    spec("REG-020/http", "Invalid Email Formats (backend only)", "Registration.Backend_Validation",
+         "BackendValidationTests", ["invalid_email_formats"], ["registration", "email", "validation", "http"],
+         table="REG-020", batch=True),
+    spec("REG-021/http", "Excessive Email Length Boundary Test (backend only)", "Registration.Backend_Validation",
+         "BackendValidationTests", ["excessive_email_length_boundary"], ["registration", "email", "boundary", "http"],
+         table="REG-021", batch=True),
+    spec("REG-014/http", "Password Field Illegal & Special Characters Handling (backend only)",
+         "Registration.Backend_Validation", "BackendValidationTests", ["password_illegal_special_characters"],
+         ["registration", "password", "security", "http"], table="REG-014", batch=True),
+    spec("REG-016/http", "Excessive Username Length Boundary Test (backend only)", "Registration.Backend_Validation",
+         "BackendValidationTests", ["excessive_username_length_boundary"], ["registration", "username", "boundary", "http"],
+         table="REG-016", batch=True),
+    spec("REG-062/http", "Bypass Frontend Validation (backend only)", "Registration.Backend_Validation",
+         "BackendValidationTests", ["bypass_frontend_validation"], ["registration", "security", "http"],
+         resources={BYPASS_EMAIL: EXCLUSIVE}),
+    spec("REG-067/race", "Same-email registration race, N racers over independent connections",
+         "Registration.Race_Conditions", "RaceConditionTests", ["same_email_race"],
+         ["registration", "concurrency", "race", "http"]),
+    spec("LGN-002", "Missing Email (Submit Empty Email)", "Login.Basic_Authentication", "LoginValidationTests",
+         ["missing_email"], ["login", "validation", "browser"]),
+    spec("LGN-006", "Email With Leading/Trailing Spaces", "Login.Basic_Authentication", "LoginValidationTests",
+         ["email_with_spaces"], ["login", "email", "normalization", "browser"], resources=LOGS_IN),
+    spec("LGN-010", "Account Lockout After Consecutive Failed Logins", "Login.Security", "LoginSecurityTests",
+         ["account_lockout_after_failed_attempts"], ["login", "security", "lockout", "browser"], resources=LOCKS_OUT),
+    spec("LGN-010/burst", "Lockout under concurrent failed logins (one account)", "Login.Lockout_Bursts",
+         "LockoutBurstTests", ["lockout_burst_single_account"], ["login", "security", "lockout", "concurrency", "http"],
+         resources=LOCKS_OUT),
+    spec("LGN-011", "Common/Default Admin Passwords & Weak Credential Rejection", "Login.Security", "LoginSecurityTests",
+         ["common_admin_passwords_and_weak_credential_handling"], ["login", "security", "browser"], table="LGN-011",
+         resources={**LOCKS_OUT, ADMIN_ACCOUNT: EXCLUSIVE}),
+    spec("LGN-016", "Concurrent Login with Same User (Session Handling)", "Login.Security", "LoginSecurityTests",
+         ["concurrent_login_same_user"], ["login", "security", "concurrency", "browser"], resources=LOGS_IN),
+    spec("LGN-017/burst", "Lockout scope under concurrent failed logins (many accounts)", "Login.Lockout_Bursts",
+         "LockoutBurstTests", ["lockout_burst_many_accounts"], ["login", "security", "lockout", "concurrency", "http"],
+         resources=LOCKS_OUT),
+    spec("LGN-016/race", "Concurrent logins of the same user, N racers over independent connections",
+         "Login.Race_Conditions", "LoginRaceTests", ["concurrent_login_race"], ["login", "concurrency", "race", "http"],
+         resources=LOGS_IN),
+    spec("LGN-017", "Account Lockout Scope (Per Account, Not Per IP)", "Login.Security", "LoginSecurityTests",
+         ["lockout_scope_per_account_not_per_ip"], ["login", "security", "lockout", "browser"], resources=LOCKS_OUT),
+]
+
+REGISTRY = {test["id"]: test for test in TESTS}
+TAGS = sorted({tag for test in TESTS for tag in test["tags"]})
+
+# Browser runs of case tables whose backend checks run over HTTP (the /http twins): they only add the
+# front-end side (type=email, maxlength, JS validation), so they run when selected, not by default
+UI_ONLY = "ui-only"
+
+# "REG-020 - Invalid Email Formats [double-at]" -> test ID "REG-020", row "double-at"
+TEST_NAME_PATTERN = re.compile(r"(?P<test_id>(?:REG|LGN)-\d{3}(?:/\w+)?)\b.*?(?: \[(?P<row>[^\]]+)\])?$")
+
+def plan_position(name):
+    # Sort key for a result name: registry order, then case-table row order; names outside the registry last
+    match = TEST_NAME_PATTERN.match(name)
+    test = REGISTRY.get(match["test_id"]) if match else None
+    if test is None:
+        return (len(TESTS), 0)
+    rows = row_ids(test["table"]) if test["table"] else []
+    return (TESTS.index(test), rows.index(match["row"]) + 1 if match["row"] in rows else 0)
+
+def select(selectors=None):
+    # Selectors are test IDs, ID globs ("REG-0*", "*/http") or tag names ("security"); no selectors = the
+    # default plan, everything except UI_ONLY tests. The result keeps registry order.
+    if not selectors:
+        return [test for test in TESTS if UI_ONLY not in test["tags"]]
+    chosen = set()
+    for selector in selectors:
+        if selector in TAGS:
+            hits = {test["id"] for test in TESTS if selector in test["tags"]}
+        else:
+            hits = {test["id"] for test in TESTS if fnmatch.fnmatchcase(test["id"].upper(), selector.upper())}
+        if not hits:
+            raise KeyError(f"No test ID or tag matches '{selector}'")
+        chosen |= hits
+    return [test for test in TESTS if test["id"] in chosen]
+
+def jobs(tests):
+    # Job: (job ID, module, suite class, methods run in order, case-table rows or None).
+    # Tests with a case table are fanned out into one job per row, unless the table is batched.
+    expanded = []
+    for test in tests:
+        if test["table"] and not test["batch"]:
+            expanded.extend((f"{test['id']} [{row}]", test["module"], test["class"], test["methods"], [row])
+                            for row in row_ids(test["table"]))
+        else:
+            expanded.append((test["id"], test["module"], test["class"], test["methods"], None))
+    return expanded
+
+def row_jobs(test, rows):
+    # Jobs running only the given rows of a test with a case table, e.g. the rows that failed last time
+    if test["batch"]:
+        return [(test["id"], test["module"], test["class"], test["methods"],
+                 [row for row in row_ids(test["table"]) if row in rows])]
+    return [job for job in jobs([test]) if job[4][0] in rows]
+
+def load_suite(module_name, class_name):
+    return getattr(importlib.import_module(module_name), class_name)
+
+def job_test(job):
+    # "LGN-011 [admin-admin]" -> the LGN-011 spec
+    return REGISTRY[job[0].split(" [", 1)[0]]
+
+def conflicts(a, b):
+    # Resource maps of two tests collide on anything both touch, unless both only share it
+    return any(name in b and EXCLUSIVE in (mode, b[name]) for name, mode in a.items())
+
+def waves(jobs, width):
+    # Packs jobs into waves of at most `width` that can all run at once. Jobs that conflict with the most
+    # others are placed first, so the chain that has to run one wave after another starts right away and
+    # conflict-free jobs fill the gaps beside it. Each job goes into the first wave with room after every
+    # job placed before it that it conflicts with; a test's rows keep their order.
+    resources = [job_test(job)["resources"] for job in jobs]
+    degree = [sum(conflicts(mine, other) for other in resources) for mine in resources]
+    schedule, placed = [], []           # placed: (wave index, resources) of every job so far
+    for position in sorted(range(len(jobs)), key=lambda i: -degree[i]):
+        earliest = max((index + 1 for index, other in placed if conflicts(resources[position], other)), default=0)
+        index = next(i for i in itertools.count(earliest) if i == len(schedule) or len(schedule[i]) < width)
+        if index == len(schedule):
+            schedule.append([])
+        schedule[index].append(jobs[position])
+        placed.append((index, resources[position]))
+    return schedule
@@ -0,0 +1,85 @@
+# result_collector.py
+import os
+import json
+import threading
+from datetime import datetime
+
+class AppendStream:
+    # JSON Lines file shared by every thread and worker process of a run. Each process opens its own
+    # O_APPEND descriptor and every line goes out in a single unbuffered write(), so lines never interleave
+    # and everything written survives a crash of the writer.
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+        self._pid = None
+        self._open_lock = threading.Lock()
+
+    def _stream(self):
+        if self._pid != os.getpid():
+            with self._open_lock:
+                if self._pid != os.getpid():
+                    self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    self._pid = os.getpid()
+        return self._fd
+
+    def append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        os.write(self._stream(), line.encode("utf-8"))
+
+    def entries(self):
+        try:
+            stream = open(self.path, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with stream:
+            for line in stream:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Last line cut short by a crash
+                    continue
+
+class ResultCollector:
+    def __init__(self, path):
+        # Every result is appended to this JSON Lines file the moment it is logged; the final report is
+        # folded from it, so a crash or Ctrl-C keeps everything logged so far and nothing piles up in memory
+        self.path = path
+        self._stream = AppendStream(path)
+
+    def record(self, name, status, message="", bug_details=None):
+        entry = {
+            "name": name, "status": status, "message": message,
+            "bug": bug_details,
+            "timestamp": datetime.now().isoformat()
+        }
+        self._stream.append(entry)
+        return entry
+
+    def entries(self):
+        return self._stream.entries()
+
+    def merge(self, order=None):
+        # order: sort key for a result name. Parallel workers append in whatever order they finish, so the
+        # report is put back in plan order to read the same as a serial run; ties keep stream order.
+        results = {"total": 0, "passed": 0, "failed": 0, "bugs": [], "test_cases": []}
+        entries = self.entries()
+        if order is not None:
+            entries = sorted(entries, key=lambda entry: order(entry["name"]))
+        for entry in entries:
+            results["total"] += 1
+            if entry["status"] == "PASS":
+                results["passed"] += 1
+            else:
+                results["failed"] += 1
+                if entry["bug"]:
+                    results["bugs"].append({
+                        "test_name": entry["name"],
+                        "description": entry["message"],
+                        "details": entry["bug"],
+                        "timestamp": entry["timestamp"]
+                    })
+            results["test_cases"].append({
+                "name": entry["name"], "status": entry["status"], "message": entry["message"],
+                "timestamp": entry["timestamp"]
+            })
+        return results
@@ -0,0 +1,143 @@
+# result_detector.py
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+# Known outcome markers per flow: URL fragments, visible text fragments, CSS selectors
+REGISTRATION_OUTCOME = {
+    "name": "registration_result",
+    "urls": ["/login.jsp?register=success"],
+    "texts": ["sign in", "error", "already been registered", "⚠️"],
+    "selectors": [],
+}
+SIGN_IN_OUTCOME = {
+    "name": "sign_in_result",
+    "urls": ["/welcome.jsp"],
+    "texts": ["sign in", "error", "already been registered", "⚠️"],
+    "selectors": [],
+}
+LOGIN_OUTCOME = {
+    "name": "login_result",
+    "urls": ["/welcome.jsp"],
+    "texts": ["Incorrect", "locked", "Invalid credentials", "too many"],
+    "selectors": ["div.error-message"],
+}
+
+# Set on the page right before a submit; a document without it has replaced the submitted one.
+# The submit listener tells a form the browser actually sent from one its own validation blocked.
+MARK_SUBMIT_SCRIPT = """
+window.__autotestSubmitted = true;
+window.__autotestSubmitFired = false;
+document.addEventListener('submit', function () { window.__autotestSubmitFired = true; }, {capture: true, once: true});
+"""
+NO_SUBMIT = "no-submit"     # outcome when the stamped form was never sent, so no response will come
+NO_SUBMIT_GRACE = 0.5       # seconds a click gets to turn into a submit event
+
+# Resolves with the first matching marker. Text is checked once for the whole document and
+# afterwards only for nodes the MutationObserver reports, instead of re-scanning the DOM.
+# Only text nodes outside <script>/<style> count, like the text() nodes the XPath check used to match.
+DETECT_SCRIPT = """
+const outcome = arguments[0], stamped = arguments[1], grace = arguments[2], done = arguments[arguments.length - 1];
+let finished = false, submitTimer = null;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearInterval(urlTimer);
+    clearTimeout(submitTimer);
+    done(result);
+}
+function checkUrl() {
+    for (const part of outcome.urls) {
+        if (location.href.includes(part)) return 'url:' + part;
+    }
+    return null;
+}
+const HIDDEN = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+function visibleText(root) {
+    if (root.nodeType === Node.TEXT_NODE) {
+        return root.parentNode && HIDDEN.has(root.parentNode.nodeName) ? '' : root.data;
+    }
+    if (root.nodeType !== Node.ELEMENT_NODE || HIDDEN.has(root.nodeName)) return '';
+    const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+        acceptNode: node => HIDDEN.has(node.parentNode.nodeName) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+    });
+    let text = '';
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) text += node.data;
+    return text;
+}
+function checkText(text) {
+    if (!text) return null;
+    for (const marker of outcome.texts) {
+        if (text.includes(marker)) return 'text:' + marker;
+    }
+    return null;
+}
+function checkSelectors(root) {
+    for (const selector of outcome.selectors) {
+        if ((root.matches && root.matches(selector)) || (root.querySelector && root.querySelector(selector))) {
+            return 'selector:' + selector;
+        }
+    }
+    return null;
+}
+
+const observer = new MutationObserver(function (mutations) {
+    for (const mutation of mutations) {
+        const nodes = mutation.type === 'characterData' ? [mutation.target] : mutation.addedNodes;
+        for (const node of nodes) {
+            const hit = checkText(visibleText(node)) || (node.nodeType === 1 && checkSelectors(node));
+            if (hit) return finish(hit);
+        }
+    }
+    const hit = checkUrl();
+    if (hit) finish(hit);
+});
+const urlTimer = setInterval(function () {
+    const hit = checkUrl();
+    if (hit) finish(hit);
+}, 100);
+
+// Still on the document we submitted from: its existing markers (e.g. the previous attempt's
+// error message) are stale, so only react to what changes from here on
+const stale = stamped && window.__autotestSubmitted;
+const initial = checkUrl() || (!stale && (checkSelectors(document) || checkText(visibleText(document.documentElement))));
+if (initial) {
+    finish(initial);
+} else if (stamped && !window.__autotestSubmitted) {
+    // The submitted document was replaced: the server has answered, even without a marker
+    finish('navigated');
+} else {
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    if (stale && !window.__autotestSubmitFired) {
+        // No submit event yet: unless one follows shortly, the browser blocked the form (e.g. type=email
+        // validation) and nothing was sent, so there is no response to wait for
+        submitTimer = setTimeout(function () {
+            if (!window.__autotestSubmitFired) finish('no-submit');
+        }, grace * 1000);
+    }
+}
+"""
+
+NAVIGATION_ERRORS = ("unloaded", "navigated", "execution context")
+
+def mark_submit(driver):
+    driver.execute_script(MARK_SUBMIT_SCRIPT)
+
+def wait_for_outcome(driver, outcome, timeout, stamped=False):
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        driver.set_script_timeout(remaining)
+        try:
+            return driver.execute_async_script(DETECT_SCRIPT, outcome, stamped, NO_SUBMIT_GRACE)
+        except TimeoutException:
+            return None
+        except WebDriverException as e:
+            # "document unloaded while waiting for result": the page navigated mid-wait.
+            # Run again on the new document, which is then checked straight away.
+            if not any(hint in str(e) for hint in NAVIGATION_ERRORS):
+                raise
+            stamped = True
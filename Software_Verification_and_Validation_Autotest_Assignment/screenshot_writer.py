@@ -0,0 +1,54 @@
+# screenshot_writer.py
+import queue
+import atexit
+import logging
+import threading
+from artifact_store import artifact_store
+
+logger = logging.getLogger(__name__)
+
+class ScreenshotWriter:
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, folder, name, png):
+        self._ensure_started()
+        self._queue.put((folder, name, png))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, folder, name, png):
+        # Identical captures (e.g. a test's own screenshot followed by the FAIL_ one from
+        # log_test_result) are stored once by the artifact store and only indexed twice
+        try:
+            artifact_store.put(folder, name, png)
+        except Exception as e:
+            logger.error(f"Failed to store screenshot {name}: {e}")
+
+    def flush(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def shutdown(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+screenshot_writer = ScreenshotWriter()
+atexit.register(screenshot_writer.shutdown)
@@ -0,0 +1,316 @@
+# standin_server.py
+import os
+import re
+import time
+import random
+import secrets
+import argparse
+import logging
+import threading
+from html import escape
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit, parse_qs
+
+logger = logging.getLogger(__name__)
+
+# Hermetic in-process replacement for the register/login/welcome JSP app
+STANDIN_LATENCY = float(os.environ.get("AUTOTEST_STANDIN_LATENCY", "0"))        # seconds added to every request
+STANDIN_FAULT_RATE = float(os.environ.get("AUTOTEST_STANDIN_FAULT_RATE", "0"))  # share of requests answered with a 500
+LOCKOUT_SECONDS = 300
+PASSWORD_MIN, PASSWORD_MAX = 3, 25
+EMAIL_MAX = 100
+SEED_ACCOUNTS = {"admin@system.com": ("admin", "LA2028sGoldM")}
+EMAIL_PATTERN = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}$")
+SESSION_COOKIE = "JSESSIONID"
+RESET_PATH = "/__standin/reset"
+# /__scope/<name>/... is served by an app of its own, so every worker gets private state it can reset
+# (<prefix>/__standin/reset) without wiping anyone else's. Paths without the prefix share the default app.
+SCOPE_PREFIX = "/__scope/"
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body><section class="container">{body}</section></body></html>"""
+
+REGISTER_BODY = """<h2>Create an account</h2>
+{error}<form method="post" action="register.jsp">
+  <input type="text" name="username" value="{username}">
+  <input type="email" name="email" value="{email}">
+  <input type="password" name="password">
+  <input type="password" name="confirmPassword">
+  <input type="checkbox" name="terms" id="form2Example3c" value="agree">
+  <label for="form2Example3c">I agree to the Terms of service</label>
+  <button type="submit">Register</button>
+</form>
+<p>Already have an account? <a href="login.jsp">Login here</a></p>"""
+
+LOGIN_BODY = """<h2>Sign in</h2>
+{notice}{error}<form method="post" action="login.jsp">
+  <input type="email" name="email" value="{email}">
+  <input type="password" name="password">
+  <button type="submit">Sign in</button>
+</form>
+<p>No account yet? <a href="register.jsp">Register</a></p>"""
+
+WELCOME_BODY = """<h2>Welcome back, {username}!</h2>
+<p>You are logged in as {email}.</p>"""
+
+def error_block(message):
+    return f'<div class="error-message">⚠️ {escape(message)}</div>\n' if message else ""
+
+class StandInApp:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # email (lower-cased) -> account; emails are unique case-insensitively like the real app
+            self.accounts = {email: {"username": username, "password": password, "failures": 0, "locked_until": 0}
+                             for email, (username, password) in SEED_ACCOUNTS.items()}
+            self.sessions = {}
+
+    def register(self, fields):
+        username = fields.get("username", "")
+        email = fields.get("email", "")
+        password = fields.get("password", "")
+        key = email.strip().lower()
+
+        if not username or not email or not password:
+            error = "All fields are required"
+        elif len(email) > EMAIL_MAX or not EMAIL_PATTERN.match(email.strip()):
+            error = "Please enter a valid email address"
+        elif not PASSWORD_MIN <= len(password) <= PASSWORD_MAX:
+            error = f"Invalid password: {PASSWORD_MIN} ≤ length ≤ {PASSWORD_MAX} characters"
+        elif password != fields.get("confirmPassword"):
+            error = "Passwords do not match"
+        elif not fields.get("terms"):
+            error = "You must agree to the Terms of service"
+        else:
+            with self._lock:
+                if key in self.accounts:
+                    error = "This email address has already been registered"
+                else:
+                    self.accounts[key] = {"username": username, "password": password, "failures": 0, "locked_until": 0}
+                    return None
+        return error
+
+    def login(self, fields):
+        # Returns (session id, None) on success, (None, error message) otherwise.
+        # Imported here: callers point the harness at this server before test_base (and pages) load.
+        from test_base import LOCKOUT_THRESHOLD
+        key = fields.get("email", "").strip().lower()
+        if not key:
+            return None, "Email required"
+        with self._lock:
+            account = self.accounts.get(key)
+            if account is None:
+                return None, "Incorrect email or password"
+            if account["locked_until"] > time.monotonic():
+                return None, "Account is locked: too many failed attempts, try again later"
+            if account["password"] != fields.get("password", ""):
+                account["failures"] += 1
+                if account["failures"] >= LOCKOUT_THRESHOLD:
+                    account["locked_until"] = time.monotonic() + LOCKOUT_SECONDS
+                    account["failures"] = 0
+                return None, "Incorrect email or password"
+            account["failures"] = 0
+            session = secrets.token_hex(16)
+            self.sessions[session] = key
+            return session, None
+
+    def account_for(self, session):
+        with self._lock:
+            key = self.sessions.get(session)
+            return (key, self.accounts[key]) if key else (None, None)
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, so pooled clients reuse their connections
+    # Headers and body go out in separate writes; with Nagle on, the body waits for the client's delayed ACK
+    # (~40 ms per response), which would dwarf the zero-latency stand-in's real cost
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def send_page(self, status, title, body, headers=()):
+        payload = PAGE.format(title=title, body=body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def redirect(self, location, headers=()):
+        self.send_response(302)
+        self.send_header("Location", f"{self.scope_base}{location}")
+        self.send_header("Content-Length", "0")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+
+    def session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+
+    def do_GET(self):
+        self.handle_request({})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8", errors="replace")
+        self.handle_request({k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()})
+
+    def handle_request(self, fields):
+        start = time.perf_counter()
+        try:
+            self.route(fields)
+        finally:
+            self.server.account(time.perf_counter() - start)
+
+    def route(self, fields):
+        server = self.server
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        path, self.scope_base, scope = url.path, "", ""
+        if path.startswith(SCOPE_PREFIX):
+            scope, _, rest = path[len(SCOPE_PREFIX):].partition("/")
+            path, self.scope_base = f"/{rest}", f"{SCOPE_PREFIX}{scope}"
+        app = server.app_for(scope)
+
+        if path == RESET_PATH:
+            app.reset()
+            return self.send_page(200, "Reset", "<p>reset</p>")
+
+        if server.latency:
+            time.sleep(server.latency)
+        if server.fault_rate and random.random() < server.fault_rate:
+            return self.send_page(500, "Error", "<h1>HTTP Status 500</h1><p>java.lang.IllegalStateException: injected fault</p>")
+
+        if path == "/register.jsp":
+            if self.command == "POST":
+                error = app.register(fields)
+                if error is None:
+                    return self.redirect("/login.jsp?register=success")
+            else:
+                error = None
+            return self.send_page(200, "Register", REGISTER_BODY.format(
+                error=error_block(error), username=escape(fields.get("username", "")), email=escape(fields.get("email", ""))))
+
+        if path == "/login.jsp":
+            if self.command == "POST":
+                session, error = app.login(fields)
+                if session:
+                    return self.redirect("/welcome.jsp", [("Set-Cookie", f"{SESSION_COOKIE}={session}; Path=/; HttpOnly")])
+            else:
+                error = None
+            notice = "<p>Registration successful! Please sign in.</p>\n" if query.get("register") == "success" else ""
+            return self.send_page(200, "Login", LOGIN_BODY.format(
+                notice=notice, error=error_block(error), email=escape(fields.get("email", ""))))
+
+        if path == "/welcome.jsp":
+            email, account = app.account_for(self.session())
+            if account is None:
+                return self.redirect("/login.jsp")
+            return self.send_page(200, "Welcome", WELCOME_BODY.format(username=escape(account["username"]), email=escape(email)))
+
+        if path == "/":
+            return self.redirect("/login.jsp")
+        self.send_page(404, "Not Found", "<h1>HTTP Status 404</h1>")
+
+class StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, address, handler):
+        super().__init__(address, handler)
+        # Time spent inside request handlers, so benchmarks can tell server time from harness time
+        self.served = 0
+        self.busy = 0.0
+        self._stats_lock = threading.Lock()
+        self.apps = {"": StandInApp()}      # scope name -> app; "" is the default, unscoped app
+        self._apps_lock = threading.Lock()
+
+    def app_for(self, scope):
+        with self._apps_lock:
+            if scope not in self.apps:
+                self.apps[scope] = StandInApp()
+            return self.apps[scope]
+
+    def reset(self, scope=None):
+        # One scope, or every scope when none is given
+        with self._apps_lock:
+            apps = list(self.apps.values()) if scope is None else [self.apps.get(scope)]
+        for app in apps:
+            if app is not None:
+                app.reset()
+
+    def account(self, seconds):
+        with self._stats_lock:
+            self.served += 1
+            self.busy += seconds
+
+class StandInServer:
+    def __init__(self, host="127.0.0.1", port=0, latency=STANDIN_LATENCY, fault_rate=STANDIN_FAULT_RATE):
+        self.httpd = StandInHTTPServer((host, port), StandInHandler)
+        # Handlers read these per request, so they can be changed while the server runs
+        self.httpd.latency = latency
+        self.httpd.fault_rate = fault_rate
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def app(self):
+        return self.httpd.app_for("")
+
+    def scope_url(self, scope):
+        return f"{self.base_url}{SCOPE_PREFIX}{scope}"
+
+    def configure(self, latency=None, fault_rate=None):
+        if latency is not None:
+            self.httpd.latency = latency
+        if fault_rate is not None:
+            self.httpd.fault_rate = fault_rate
+
+    def reset(self, scope=None):
+        self.httpd.reset(scope)
+
+    def stats(self):
+        # (requests served, seconds spent handling them) since the server started
+        return self.httpd.served, self.httpd.busy
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, name="standin-server", daemon=True)
+            self._thread.start()
+            logger.info(f"Stand-in app serving on {self.base_url}")
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Stand-in register/login app for the test suite")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=STANDIN_LATENCY, help="seconds added to every request")
+    parser.add_argument("--fault-rate", type=float, default=STANDIN_FAULT_RATE, help="share of requests failing with 500")
+    args = parser.parse_args()
+
+    server = StandInServer(args.host, args.port, args.latency, args.fault_rate).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
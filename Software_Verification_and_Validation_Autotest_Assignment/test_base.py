@@ -2,12 +2,20 @@
 import time
 import logging
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 import os
 import json
+from driver_pool import driver_pool
+from result_collector import ResultCollector
+from screenshot_writer import screenshot_writer
+from pages import RegisterPage, LoginPage
+from adaptive_timeouts import adaptive_timeouts
+from timeline import timeline
+from fixture_accounts import account_pool
+from registry import plan_position
+from result_detector import wait_for_outcome, NO_SUBMIT, REGISTRATION_OUTCOME, SIGN_IN_OUTCOME, LOGIN_OUTCOME
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,78 +25,139 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 TIMEOUT = 10
-test_results = {
-    "total": 0, "passed": 0, "failed": 0, "bugs": [], "test_cases": []
-}
+# Failed logins that lock an account. The stand-in enforces this and the lockout tests judge by it;
+# against the real app, set it to what the app enforces.
+LOCKOUT_THRESHOLD = int(os.environ.get("AUTOTEST_LOCKOUT_THRESHOLD", "5"))
+# "typing" sends real keystrokes field by field; "fast" sets the whole form in one script call.
+# Set explicitly, AUTOTEST_FILL_MODE also overrides the mode a test asks for (e.g. typing everywhere for fidelity).
+FILL_MODE_OVERRIDE = os.environ.get("AUTOTEST_FILL_MODE")
+FILL_MODE = FILL_MODE_OVERRIDE or "typing"
+# auto_test sets the variable before spawning workers, so they all append to the parent's stream
+RESULTS_STREAM = os.environ.get("AUTOTEST_RESULTS_STREAM") or f"RESULTS_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+collector = ResultCollector(RESULTS_STREAM)
 
 class TestBase:
+    fill_mode = FILL_MODE
+    fill_mode_override = FILL_MODE_OVERRIDE
+
     def __init__(self):
         self.driver = None
         self.wait = None
         self.screenshot_folder = None
+        self.submit_stamped = False
+        self.accounts = []
+        self.register_page = RegisterPage(self)
+        self.login_page = LoginPage(self)
 
     def setup(self, headless=False):
         try:
-            options = webdriver.ChromeOptions()
-            options.add_argument('--start-maximized')
-            if headless:
-                options.add_argument('--headless')
-            self.driver = webdriver.Chrome(options=options)
+            with timeline.span("driver lease", "fixture"):
+                self.driver = driver_pool.lease(headless)
             self.wait = WebDriverWait(self.driver, TIMEOUT)
 
             self.screenshot_folder = f"screenshots/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             os.makedirs(self.screenshot_folder, exist_ok=True)
 
-            logger.info("WebDriver initialized")
             return True
         except Exception as e:
             logger.error(f"WebDriver init failed: {e}")
             return False
 
     def teardown(self):
+        self.release_accounts()
         if self.driver:
-            self.driver.quit()
-            logger.info("WebDriver closed")
+            with timeline.span("driver release", "fixture"):
+                driver_pool.release(self.driver)
+            self.register_page.invalidate()
+            self.login_page.invalidate()
+            self.driver = None
+            self.wait = None
 
-    def log_test_result(self, test_name, status, message="", bug_details=None):
-        test_results["total"] += 1
+    def start_test(self, test_name, detail=None):
+        logger.info(f"Starting {test_name}: {detail}" if detail else f"Starting {test_name}")
+        # Timeline spans from this thread are attributed to the test ID ("REG-020", "REG-020/http", ...)
+        timeline.set_test(test_name.split(" - ")[0])
+        # Suites run their tests one after another on one instance; the previous test is done with its accounts
+        self.release_accounts()
+
+    def lease_account(self):
+        # A fixture account for the running test alone; see fixture_accounts for state tracking
+        account = account_pool.lease(timeline.current_test() or type(self).__name__)
+        self.accounts.append(account)
+        return account
+
+    def release_accounts(self):
+        for account in self.accounts:
+            account_pool.release(account)
+        self.accounts = []
+
+    def wait_for_page_ready(self, driver=None, timeout=TIMEOUT):
+        WebDriverWait(driver or self.driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete")
+
+    def wait_for_result(self, outcome, timeout=None):
+        # Without an explicit timeout, wait as long as this outcome has historically needed (p99 + margin)
+        shortened = timeout is None
+        if shortened:
+            timeout = adaptive_timeouts.timeout(outcome["name"], TIMEOUT)
+            shortened = timeout < TIMEOUT
+        stamped, self.submit_stamped = self.submit_stamped, False
+
+        start = time.monotonic()
+        with timeline.span(f"wait {outcome['name']}", "wait"):
+            result = wait_for_outcome(self.driver, outcome, timeout, stamped)
+        if result == NO_SUBMIT:
+            # Expected no-marker case (the browser never sent the form): its real time, kept apart from the
+            # server response times the timeout is derived from
+            adaptive_timeouts.record(f"{outcome['name']}/{NO_SUBMIT}", time.monotonic() - start)
+        elif result is not None:
+            adaptive_timeouts.record(outcome["name"], time.monotonic() - start)
+        elif shortened:
+            # A real response slower than the timeout: the timeout grows back, by at most MARGIN per miss
+            adaptive_timeouts.record_censored(outcome["name"], timeout)
+        return result
+
+    def wait_for_registration_result(self, timeout=None):
+        if self.wait_for_result(REGISTRATION_OUTCOME, timeout) is None:
+            logger.warning("Waiting for registration result timed out")
+
+    def wait_for_sign_in_result(self, timeout=None):
+        if self.wait_for_result(SIGN_IN_OUTCOME, timeout) is None:
+            logger.warning("Login/Registration result timeout")
 
+    def wait_for_login_result(self, timeout=None):
+        if self.wait_for_result(LOGIN_OUTCOME, timeout) is None:
+            logger.warning("Login result wait timeout")
+
+    def log_test_result(self, test_name, status, message="", bug_details=None):
         if status != "PASS":
             safe_name = "".join(c if c.isalnum() or c in " _-()" else "_" for c in test_name)
             self.take_screenshot(f"{status}_{safe_name}")
 
         if status == "PASS":
-            test_results["passed"] += 1
             logger.info(f"PASS {test_name}: {message}")
         else:
-            test_results["failed"] += 1
             logger.error(f"FAIL {test_name}: {message}")
-            if bug_details:
-                test_results["bugs"].append({
-                    "test_name": test_name,
-                    "description": message,
-                    "details": bug_details,
-                    "timestamp": datetime.now().isoformat()
-                })
-        test_results["test_cases"].append({
-            "name": test_name, "status": status, "message": message,
-            "timestamp": datetime.now().isoformat()
-        })
+        collector.record(test_name, status, message, bug_details)
 
     def take_screenshot(self, name):
         try:
-            path = f"{self.screenshot_folder}/{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            self.driver.save_screenshot(path)
-            logger.info(f"Screenshot saved: {path}")
+            # Only the capture happens on the test thread; hashing and disk I/O are done by the writer thread
+            screenshot_writer.submit(self.screenshot_folder, name, self.driver.get_screenshot_as_png())
         except Exception as e:      
             logger.error(f"Failed to take screenshot: {e}")
 
     def generate_report(self, final=False):
         if not final:
             return
+        screenshot_writer.flush()
+        adaptive_timeouts.save()
+        if timeline.enabled:
+            timeline.export()
         logger.info("\n" + "="*70)
         logger.info("           FINAL AUTOMATED TEST REPORT")
         logger.info("="*70)
+        test_results = collector.merge(order=plan_position)
         total = test_results["total"]
         passed = test_results["passed"]
         rate = (passed/total*100) if total else 0
@@ -108,5 +177,16 @@ class TestBase:
         report_file = f"FINAL_REPORT_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         with open(report_file, 'w', encoding='utf-8') as f:
             json.dump(test_results, f, indent=2, ensure_ascii=False, default=str)
-        logger.info(f"\nFinal report saved: {report_file}")
-        logger.info("="*70)
\ No newline at end of file
+        logger.info(f"\nFinal report saved: {report_file} (streamed results: {RESULTS_STREAM})")
+        logger.info("="*70)
+
+class HttpTestBase(TestBase):
+    # Suites that drive the app over plain HTTP (http_client) and never start a browser
+    def setup(self, headless=False):
+        return True
+
+    def teardown(self):
+        self.release_accounts()
+
+    def take_screenshot(self, name):
+        logger.debug(f"HTTP fast path, no screenshot for {name}")
\ No newline at end of file
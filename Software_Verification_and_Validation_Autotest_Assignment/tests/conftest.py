@@ -0,0 +1,6 @@
+# conftest.py
+import os
+import sys
+
+# The harness modules are flat top-level modules next to this folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,60 @@
+# test_adaptive_timeouts.py
+import pytest
+
+from adaptive_timeouts import AdaptiveTimeouts, MIN_SAMPLES, MARGIN, PADDING, MIN_TIMEOUT
+
+DEFAULT = 10
+
+@pytest.fixture
+def timeouts(tmp_path):
+    return AdaptiveTimeouts(str(tmp_path / "adaptive_timeouts.json"))
+
+def test_default_until_enough_samples(timeouts):
+    for _ in range(MIN_SAMPLES - 1):
+        timeouts.record("login_result", 0.2)
+    assert timeouts.p99("login_result") is None
+    assert timeouts.timeout("login_result", DEFAULT) == DEFAULT
+
+def test_p99_of_a_full_window(timeouts):
+    for n in range(1, 201):
+        timeouts.record("login_result", n / 100)
+    assert timeouts.p99("login_result") == 1.99
+
+def test_timeout_is_p99_with_margin(timeouts):
+    for _ in range(100):
+        timeouts.record("login_result", 4.0)
+    assert timeouts.timeout("login_result", DEFAULT) == pytest.approx(4.0 * MARGIN + PADDING)
+
+def test_timeout_clamped_between_minimum_and_default(timeouts):
+    for _ in range(100):
+        timeouts.record("fast", 0.05)
+        timeouts.record("slow", 8.0)
+    assert timeouts.timeout("fast", DEFAULT) == MIN_TIMEOUT
+    assert timeouts.timeout("slow", DEFAULT) == DEFAULT
+
+def test_censored_sample_without_history_counts_in_full(timeouts):
+    timeouts.record_censored("login_result", 3.0)
+    assert list(timeouts._samples["login_result"]) == [3.0]
+
+def test_censored_samples_widen_the_timeout_step_by_step(timeouts):
+    for _ in range(100):
+        timeouts.record("login_result", 0.2)
+    steps = [timeouts.timeout("login_result", DEFAULT)]
+    for _ in range(10):
+        p99 = timeouts.p99("login_result")
+        timeouts.record_censored("login_result", steps[-1])
+        # A miss counts as at most p99 * MARGIN, never the whole timeout it waited
+        assert timeouts._samples["login_result"][-1] <= p99 * MARGIN + 0.001
+        steps.append(timeouts.timeout("login_result", DEFAULT))
+    assert steps == sorted(steps)
+    assert steps[1] < DEFAULT
+    assert steps[-1] > steps[0]
+
+def test_save_keeps_samples_of_other_processes(tmp_path):
+    path = str(tmp_path / "adaptive_timeouts.json")
+    first, second = AdaptiveTimeouts(path), AdaptiveTimeouts(path)
+    first.record("login_result", 0.1)
+    second.record("login_result", 0.3)
+    first.save()
+    second.save()
+    assert list(AdaptiveTimeouts(path)._samples["login_result"]) == [0.1, 0.3]
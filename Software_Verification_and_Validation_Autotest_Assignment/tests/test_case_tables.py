@@ -0,0 +1,51 @@
+# test_case_tables.py
+import json
+import pytest
+
+import case_tables
+from case_tables import load_table, row_ids, row_name
+
+@pytest.fixture
+def cases_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(case_tables, "CASES_DIR", str(tmp_path))
+    case_tables._load.cache_clear()
+    yield tmp_path
+    case_tables._load.cache_clear()
+
+def write_table(folder, test_id, rows):
+    (folder / f"{test_id}.json").write_text(json.dumps({"test_id": test_id, "rows": rows}), encoding="utf-8")
+
+def test_shipped_tables_load_with_unique_ids():
+    for test_id in ("LGN-011", "REG-014", "REG-016", "REG-020", "REG-021", "REG-022", "REG-030"):
+        ids = row_ids(test_id)
+        assert ids and len(ids) == len(set(ids))
+
+def test_ids_default_to_row_index(cases_dir):
+    write_table(cases_dir, "REG-999", [{"email": "a@b.com"}, {"id": "named", "email": "c@d.com"}])
+    assert row_ids("REG-999") == ["0", "named"]
+
+def test_repeat_values_are_expanded(cases_dir):
+    write_table(cases_dir, "REG-999", [{"id": "long", "email": {"repeat": "a", "times": 5, "suffix": "@x.com"}}])
+    assert load_table("REG-999")[0]["email"] == "aaaaa@x.com"
+
+def test_rows_filter_keeps_table_order(cases_dir):
+    write_table(cases_dir, "REG-999", [{"id": "a"}, {"id": "b"}, {"id": "c"}])
+    assert [row["id"] for row in load_table("REG-999", ["c", "a"])] == ["a", "c"]
+
+def test_unknown_rows_are_refused(cases_dir):
+    write_table(cases_dir, "REG-999", [{"id": "a"}])
+    with pytest.raises(KeyError):
+        load_table("REG-999", ["missing"])
+
+def test_duplicate_ids_are_refused(cases_dir):
+    write_table(cases_dir, "REG-999", [{"id": "a"}, {"id": "a"}])
+    with pytest.raises(ValueError):
+        load_table("REG-999")
+
+def test_loaded_rows_are_copies(cases_dir):
+    write_table(cases_dir, "REG-999", [{"id": "a", "email": "a@b.com"}])
+    load_table("REG-999")[0]["email"] = "changed"
+    assert load_table("REG-999")[0]["email"] == "a@b.com"
+
+def test_row_name():
+    assert row_name("REG-020 - Invalid Email Formats", {"id": "double-at"}) == "REG-020 - Invalid Email Formats [double-at]"
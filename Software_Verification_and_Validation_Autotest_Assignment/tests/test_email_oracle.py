@@ -0,0 +1,53 @@
+# test_email_oracle.py
+import pytest
+
+from email_oracle import check, is_valid, disagreement
+
+@pytest.mark.parametrize("email", [
+    "user@example.com",
+    "first.last+tag@sub.example.co.uk",
+    "o'brien@example.org",
+    '"quoted local"@example.com',
+    '"a@b"@example.com',
+    "user@[192.168.0.1]",
+    "user@xn--bcher-kva.example",
+    "user@bücher.example",
+    "ünïcode@example.com",
+    f"{'a' * 64}@example.com",
+])
+def test_accepts_valid_addresses(email):
+    assert check(email) is None
+    assert is_valid(email)
+
+@pytest.mark.parametrize("email, reason", [
+    ("plainaddress", "missing @"),
+    ("user@name@domain.com", "more than one @"),
+    ("@example.com", "empty local part"),
+    ("user@", "empty domain"),
+    ("user@localhost", "domain has no dot"),
+    ("user@example..com", "empty domain label"),
+    ("user@-domain.com", "illegal character or hyphen placement in domain label"),
+    ("user@domain-.com", "illegal character or hyphen placement in domain label"),
+    ("user@example.c0m", "top-level domain is not alphabetic (2+ letters)"),
+    ("user@exa mple.com", "whitespace or invisible character in domain"),
+    ("user@exa\u200bmple.com", "whitespace or invisible character in domain"),
+    ("user@[256.0.0.1]", "IPv4 literal out of range"),
+    (".user@example.com", "misplaced dot in local part"),
+    ("us..er@example.com", "misplaced dot in local part"),
+    ("us er@example.com", "illegal character in local part"),
+    (f"{'a' * 65}@example.com", "local part longer than 64 octets"),
+    (f"user@{'a' * 64}.com", "domain label longer than 63 characters"),
+    (f"{'a' * 60}@{'b' * 60}.{'c' * 60}.{'d' * 60}.{'e' * 10}.com", "address longer than 254 characters"),
+])
+def test_rejects_invalid_addresses_with_the_broken_rule(email, reason):
+    assert check(email) == reason
+    assert not is_valid(email)
+
+@pytest.mark.parametrize("email, accepted, verdict", [
+    ("user@example.com", True, None),
+    ("user@-domain.com", False, None),
+    ("user@-domain.com", True, "accepted_invalid"),
+    ("user@example.com", False, "rejected_valid"),
+])
+def test_disagreement(email, accepted, verdict):
+    assert disagreement(email, accepted) == verdict
@@ -0,0 +1,46 @@
+# test_registry.py
+import pytest
+
+from registry import REGISTRY, UI_ONLY, select, jobs, job_test, conflicts, waves
+
+def assert_valid_schedule(planned, schedule, width):
+    scheduled = [job for wave in schedule for job in wave]
+    assert sorted(scheduled) == sorted(planned)
+    for wave in schedule:
+        assert 0 < len(wave) <= width
+        resources = [job_test(job)["resources"] for job in wave]
+        for i, mine in enumerate(resources):
+            for other in resources[i + 1:]:
+                assert not conflicts(mine, other)
+
+@pytest.mark.parametrize("width", [1, 2, 4, 8])
+def test_default_plan_packs_without_conflicts(width):
+    planned = jobs(select())
+    assert_valid_schedule(planned, waves(planned, width), width)
+
+def test_full_plan_packs_without_conflicts():
+    planned = jobs(select(["*"]))
+    assert_valid_schedule(planned, waves(planned, 4), 4)
+
+def test_rows_keep_their_order_across_waves():
+    planned = jobs(select(["LGN-011"]))
+    schedule = waves(planned, 4)
+    wave_of = {job[0]: index for index, wave in enumerate(schedule) for job in wave}
+    indices = [wave_of[job[0]] for job in planned]
+    assert indices == sorted(indices)
+
+def test_exclusive_users_never_share_a_wave():
+    planned = jobs(select(["LGN-010", "LGN-017", "LGN-010/burst", "LGN-017/burst"]))
+    assert [len(wave) for wave in waves(planned, 4)] == [1, 1, 1, 1]
+
+def test_conflict_free_jobs_fill_a_wave():
+    planned = jobs(select(["REG-060", "REG-061", "REG-064", "REG-066"]))
+    assert [len(wave) for wave in waves(planned, 4)] == [4]
+
+def test_default_plan_leaves_out_ui_only_tests():
+    assert all(UI_ONLY not in test["tags"] for test in select())
+    assert any(UI_ONLY in test["tags"] for test in REGISTRY.values())
+
+def test_batched_tables_run_as_one_job():
+    assert [job[0] for job in jobs([REGISTRY["REG-020/http"]])] == ["REG-020/http"]
+    assert len(jobs([REGISTRY["REG-020"]])) > 1
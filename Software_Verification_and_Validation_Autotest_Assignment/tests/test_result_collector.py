@@ -0,0 +1,44 @@
+# test_result_collector.py
+from result_collector import ResultCollector
+from registry import plan_position
+
+def test_merge_without_order_keeps_stream_order(tmp_path):
+    collector = ResultCollector(str(tmp_path / "results.jsonl"))
+    for name in ("b", "a", "c"):
+        collector.record(name, "PASS")
+    assert [case["name"] for case in collector.merge()["test_cases"]] == ["b", "a", "c"]
+
+def test_merge_puts_out_of_order_workers_back_in_plan_order(tmp_path):
+    collector = ResultCollector(str(tmp_path / "results.jsonl"))
+    # As parallel workers might finish: later tests and later rows first
+    collector.record("LGN-002 - Login", "PASS")
+    collector.record("REG-020/http - Invalid Email Formats [double-at]", "FAIL", "accepted", {"severity": "HIGH"})
+    collector.record("Unregistered check", "PASS")
+    collector.record("REG-020/http - Invalid Email Formats [plainaddress]", "PASS")
+    collector.record("REG-022 - Valid Email Format Variants [plus-tag]", "PASS")
+
+    results = collector.merge(order=plan_position)
+    assert [case["name"] for case in results["test_cases"]] == [
+        "REG-022 - Valid Email Format Variants [plus-tag]",
+        "REG-020/http - Invalid Email Formats [plainaddress]",
+        "REG-020/http - Invalid Email Formats [double-at]",
+        "LGN-002 - Login",
+        "Unregistered check",
+    ]
+    assert (results["total"], results["passed"], results["failed"]) == (5, 4, 1)
+    assert [bug["test_name"] for bug in results["bugs"]] == ["REG-020/http - Invalid Email Formats [double-at]"]
+
+def test_merge_ties_keep_stream_order(tmp_path):
+    collector = ResultCollector(str(tmp_path / "results.jsonl"))
+    collector.record("LGN-010 - Lockout (second entry)", "PASS")
+    collector.record("LGN-010 - Lockout (first entry)", "PASS")
+    names = [case["name"] for case in collector.merge(order=plan_position)["test_cases"]]
+    assert names == ["LGN-010 - Lockout (second entry)", "LGN-010 - Lockout (first entry)"]
+
+def test_merge_skips_a_line_cut_short(tmp_path):
+    path = tmp_path / "results.jsonl"
+    collector = ResultCollector(str(path))
+    collector.record("REG-060 - Terms", "PASS")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"name": "REG-061')
+    assert collector.merge()["total"] == 1
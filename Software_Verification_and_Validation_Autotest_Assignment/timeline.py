@@ -0,0 +1,101 @@
+# timeline.py
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+from result_collector import AppendStream
+
+logger = logging.getLogger(__name__)
+
+# Off by default: set AUTOTEST_TIMELINE=1 (or pass --timeline) to time every WebDriver command, page action
+# and wait. Spans are Chrome trace "complete" events, so the exported file opens in chrome://tracing,
+# Perfetto and speedscope.
+TIMELINE_ENABLED = os.environ.get("AUTOTEST_TIMELINE") == "1"
+# setdefault: worker processes inherit the variable and append to the parent's stream
+TIMELINE_STREAM = os.environ.setdefault("AUTOTEST_TIMELINE_STREAM", f"TIMELINE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+SUMMARY_ROWS = 30       # slowest steps (by total time) shown in the log summary
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+class Timeline:
+    def __init__(self, path=TIMELINE_STREAM, enabled=TIMELINE_ENABLED):
+        self.enabled = enabled
+        self._stream = AppendStream(path)
+        self._local = threading.local()
+
+    def set_test(self, test_id):
+        # Spans recorded by this thread are attributed to test_id until the next call
+        self._local.test = test_id
+
+    def current_test(self):
+        return getattr(self._local, "test", None)
+
+    def record(self, name, cat, start_ns, end_ns, args=None):
+        self._stream.append({
+            "name": name, "cat": cat, "ph": "X",
+            "ts": start_ns // 1000, "dur": (end_ns - start_ns) // 1000,
+            "pid": os.getpid(), "tid": threading.get_native_id(),
+            "args": {"test": self.current_test(), **(args or {})}
+        })
+
+    @contextmanager
+    def span(self, name, cat="step", **args):
+        if not self.enabled:
+            yield
+            return
+        start = time.time_ns()
+        try:
+            yield
+        finally:
+            self.record(name, cat, start, time.time_ns(), args)
+
+    def instrument(self, driver):
+        # Every WebDriver command, including the ones issued by WebElements and ActionChains, goes through
+        # driver.execute; wrapping it on the instance times each one under its wire-protocol name
+        if not self.enabled:
+            return driver
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            with self.span(driver_command, "webdriver"):
+                return execute(driver_command, params)
+
+        driver.execute = timed_execute
+        return driver
+
+    def export(self):
+        events = list(self._stream.entries())
+        if not events:
+            return None
+
+        # Name each worker process so the trace viewer groups the lanes readably
+        pids = sorted({event["pid"] for event in events})
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"autotest {pid}"}}
+                    for pid in pids]
+        trace_file = f"{os.path.splitext(self._stream.path)[0]}.trace.json"
+        with open(trace_file, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+
+        steps = {}
+        for event in events:
+            steps.setdefault((event["cat"], event["name"]), []).append(event["dur"] / 1000)
+        rows = []
+        for (cat, name), samples in steps.items():
+            samples.sort()
+            rows.append((cat, name, len(samples), sum(samples), percentile(samples, 0.5),
+                         percentile(samples, 0.95), samples[-1]))
+        rows.sort(key=lambda row: row[3], reverse=True)
+
+        logger.info(f"\nStep timings (ms, {len(events)} spans, top {min(SUMMARY_ROWS, len(rows))} by total time):")
+        logger.info(f"  {'category':<10} {'step':<34} {'count':>7} {'total':>10} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+        for cat, name, count, total, p50, p95, longest in rows[:SUMMARY_ROWS]:
+            logger.info(f"  {cat:<10} {name[:34]:<34} {count:>7} {total:>10.1f} {total / count:>8.1f} "
+                        f"{p50:>8.1f} {p95:>8.1f} {longest:>8.1f}")
+        logger.info(f"Timeline saved: {trace_file} (open in chrome://tracing, ui.perfetto.dev or speedscope.app)")
+        return trace_file
+
+timeline = Timeline()